@@ -1,11 +1,19 @@
+import base64
+import io
+import logging
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
-from data_fetcher import HealthInspectionAPI
-from database import init_database, save_restaurant_to_db
-from utils import format_grade_badge, calculate_average_rating
+from PIL import Image
+from data_fetcher import HealthInspectionAPI, split_violations
+from database import init_database, save_restaurants_bulk
 from ads import ad_manager
 from delivery_affiliates import delivery_affiliate_manager
+from utils import format_inspection_date
+
+logger = logging.getLogger(__name__)
 
 # Set page configuration
 st.set_page_config(
@@ -15,370 +23,524 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Initialize session state
-if 'api_client' not in st.session_state:
-    st.session_state.api_client = HealthInspectionAPI()
-    st.session_state.current_jurisdiction = "NYC"
+# Number of restaurant cards rendered per results page
+RESULTS_PAGE_SIZE = 20
 
-# Initialize logo
-if 'logo_base64' not in st.session_state:
-    import base64
-    try:
-        with open('attached_assets/Clean Plate_1754314259976.png', 'rb') as f:
-            logo_data = f.read()
-            st.session_state.logo_base64 = base64.b64encode(logo_data).decode()
-    except FileNotFoundError:
-        # Fallback to emoji if logo file not found
-        st.session_state.logo_base64 = ""
+# Result sets larger than this open in the table view by default
+TABLE_VIEW_THRESHOLD = 50
+RESULTS_TABLE_COLUMNS = ['name', 'grade', 'score', 'inspection_ts', 'address', 'cuisine_type', 'boro']
 
-# Initialize database on startup
-init_database()
+# Cuisines offered in the advanced search filter
+CUISINE_OPTIONS = ("Italian", "Chinese", "Mexican", "American", "Japanese", "Thai", "Indian", "Mediterranean", "French", "Korean")
 
-def main():
-    
-    # Add Google AdSense verification meta tag using Streamlit's built-in method
-    st.html("""
-    <meta name="google-adsense-account" content="ca-pub-8384381342878857">
-    <style>
-        meta[name="google-adsense-account"] {
-            display: none !important;
-            visibility: hidden !important;
-            position: absolute !important;
-            left: -9999px !important;
-        }
-    </style>
-    """)
+# Display names for the City selectbox, and the reverse lookup used when it changes
+JURISDICTION_NAMES = {
+    "NYC": "New York City, NY", 
+    "Chicago": "Chicago, IL",
+    "Boston": "Boston, MA",
+    "Austin": "Austin, TX", 
+    "Seattle": "Seattle, WA",
+    "Detroit": "Detroit, MI",
+    "Los Angeles": "Los Angeles, CA"
+}
+JURISDICTION_CODES = {name: code for code, name in JURISDICTION_NAMES.items()}
+
+HEADER_TEMPLATE = """
+<div class="main-header">
+    <h1>
+        {logo_html}
+        CleanPlate
+    </h1>
+    <p>Peeking behind the kitchen door, so you can dine without doubt. We dish out health inspection scores, making informed choices deliciously easy.</p>
+</div>
+"""
+
+# Alert style for each letter grade on a card; other grades use st.info
+GRADE_ALERTS = {'A': st.success, 'B': st.warning, 'C': st.error}
+
+# Card HTML templates, filled per card with str.format_map
+TIMELINE_GRADE_BADGE_TEMPLATE = """
+<div style="background: {color}20; border: 1px solid {color}; 
+           border-radius: 5px; padding: 5px 10px; text-align: center;">
+    <span style="color: {color}; font-weight: bold; font-size: 0.9rem;">
+        {label}
+    </span>
+</div>
+"""
+
+# One inspection in the history timeline; a card's whole timeline is sent as a
+# single markdown element laid out with CSS grid instead of nested columns
+TIMELINE_ENTRY_TEMPLATE = (
+    '<div style="display: grid; grid-template-columns: 2rem 1fr 8rem; gap: 0.75rem; '
+    'align-items: center; padding: 0.5rem 0;{separator}">'
+    '<div>{icon}</div>'
+    '<div><strong>{date}</strong><br><small style="opacity: 0.7;">Type: {inspection_type}{score_text}</small></div>'
+    '{badge}'
+    '</div>'
+)
+TIMELINE_SEPARATOR_STYLE = " border-bottom: 1px solid rgba(128, 128, 128, 0.3);"
 
+# Page styles, built once at import and emitted at the top of every run
+APP_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Playfair+Display:wght@400;500;600;700&display=swap');
     
-    # RESPONSIVE DESIGN - Optimized for all devices
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Playfair+Display:wght@400;500;600;700&display=swap');
-        
-        /* Main App Background - Responsive Restaurant Atmosphere */
+    /* Main App Background - Responsive Restaurant Atmosphere */
+    .stApp {
+        background: 
+            radial-gradient(ellipse at top left, rgba(212, 175, 55, 0.05) 0%, transparent 50%),
+            radial-gradient(ellipse at bottom right, rgba(212, 175, 55, 0.03) 0%, transparent 40%),
+            linear-gradient(135deg, #0a0e13 0%, #1a1f2e 25%, #2d3748 50%, #1a1f2e 75%, #0a0e13 100%) !important;
+        color: #f7fafc !important;
+        font-family: 'Inter', sans-serif !important;
+        min-height: 100vh !important;
+        width: 100% !important;
+        overflow-x: hidden !important;
+    }
+    
+    /* Responsive Container */
+    .main .block-container {
+        padding: 1rem !important;
+        max-width: none !important;
+        width: 100% !important;
+    }
+    
+    /* Mobile-First Responsive Breakpoints */
+    @media (max-width: 640px) {
         .stApp {
-            background: 
-                radial-gradient(ellipse at top left, rgba(212, 175, 55, 0.05) 0%, transparent 50%),
-                radial-gradient(ellipse at bottom right, rgba(212, 175, 55, 0.03) 0%, transparent 40%),
-                linear-gradient(135deg, #0a0e13 0%, #1a1f2e 25%, #2d3748 50%, #1a1f2e 75%, #0a0e13 100%) !important;
-            color: #f7fafc !important;
-            font-family: 'Inter', sans-serif !important;
-            min-height: 100vh !important;
-            width: 100% !important;
-            overflow-x: hidden !important;
+            font-size: 14px !important;
         }
         
-        /* Responsive Container */
         .main .block-container {
-            padding: 1rem !important;
-            max-width: none !important;
-            width: 100% !important;
+            padding: 0.5rem !important;
         }
         
-        /* Mobile-First Responsive Breakpoints */
-        @media (max-width: 640px) {
-            .stApp {
-                font-size: 14px !important;
-            }
-            
-            .main .block-container {
-                padding: 0.5rem !important;
-            }
-            
-            /* Mobile Header */
-            .main-header {
-                padding: 2rem 1rem !important;
-                margin: -0.5rem -0.5rem 1.5rem -0.5rem !important;
-            }
-            
-            .main-header h1 {
-                font-size: 2rem !important;
-                line-height: 1.2 !important;
-            }
-            
-            .main-header span {
-                font-size: 2.5rem !important;
-                margin-right: 8px !important;
-            }
-            
-            .main-header p {
-                font-size: 0.9rem !important;
-                line-height: 1.4 !important;
-            }
+        /* Mobile Header */
+        .main-header {
+            padding: 2rem 1rem !important;
+            margin: -0.5rem -0.5rem 1.5rem -0.5rem !important;
         }
         
-        @media (min-width: 641px) and (max-width: 768px) {
-            /* Tablet Styles */
-            .main-header {
-                padding: 3rem 1.5rem !important;
-            }
-            
-            .main-header h1 {
-                font-size: 2.5rem !important;
-            }
+        .main-header h1 {
+            font-size: 2rem !important;
+            line-height: 1.2 !important;
         }
         
-        @media (min-width: 769px) {
-            /* Desktop Styles */
-            .main .block-container {
-                max-width: 1200px !important;
-                margin: 0 auto !important;
-            }
+        .main-header span {
+            font-size: 2.5rem !important;
+            margin-right: 8px !important;
         }
         
-        /* Responsive Header */
+        .main-header p {
+            font-size: 0.9rem !important;
+            line-height: 1.4 !important;
+        }
+    }
+    
+    @media (min-width: 641px) and (max-width: 768px) {
+        /* Tablet Styles */
         .main-header {
-            background: linear-gradient(135deg, rgba(20, 25, 35, 0.95) 0%, rgba(45, 55, 72, 0.9) 100%);
-            padding: 3rem 2rem;
-            margin: -1rem -1rem 2rem -1rem;
-            border-bottom: 2px solid rgba(212, 175, 55, 0.3);
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.5);
-            text-align: center;
-            width: 100%;
-            box-sizing: border-box;
+            padding: 3rem 1.5rem !important;
         }
         
         .main-header h1 {
-            color: #ffffff;
-            font-size: clamp(2rem, 5vw, 4rem);
-            font-weight: 600;
-            margin: 0;
-            font-family: 'Playfair Display', serif;
-            text-shadow: 0 4px 16px rgba(0, 0, 0, 0.4);
-            line-height: 1.2;
-            word-wrap: break-word;
+            font-size: 2.5rem !important;
         }
-        
-        .main-header p {
-            color: rgba(212, 175, 55, 0.9);
-            font-size: clamp(0.8rem, 2vw, 0.95rem);
-            margin: 1rem 0 0 0;
-            font-weight: 500;
-            letter-spacing: 0.1em;
-            font-family: 'Inter', sans-serif;
-            text-transform: uppercase;
-            line-height: 1.4;
+    }
+    
+    @media (min-width: 769px) {
+        /* Desktop Styles */
+        .main .block-container {
+            max-width: 1200px !important;
+            margin: 0 auto !important;
         }
-        
-        /* Responsive Form Controls */
+    }
+    
+    /* Responsive Header */
+    .main-header {
+        background: linear-gradient(135deg, rgba(20, 25, 35, 0.95) 0%, rgba(45, 55, 72, 0.9) 100%);
+        padding: 3rem 2rem;
+        margin: -1rem -1rem 2rem -1rem;
+        border-bottom: 2px solid rgba(212, 175, 55, 0.3);
+        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.5);
+        text-align: center;
+        width: 100%;
+        box-sizing: border-box;
+    }
+    
+    .main-header h1 {
+        color: #ffffff;
+        font-size: clamp(2rem, 5vw, 4rem);
+        font-weight: 600;
+        margin: 0;
+        font-family: 'Playfair Display', serif;
+        text-shadow: 0 4px 16px rgba(0, 0, 0, 0.4);
+        line-height: 1.2;
+        word-wrap: break-word;
+    }
+    
+    .main-header p {
+        color: rgba(212, 175, 55, 0.9);
+        font-size: clamp(0.8rem, 2vw, 0.95rem);
+        margin: 1rem 0 0 0;
+        font-weight: 500;
+        letter-spacing: 0.1em;
+        font-family: 'Inter', sans-serif;
+        text-transform: uppercase;
+        line-height: 1.4;
+    }
+    
+    /* Responsive Form Controls */
+    .stSelectbox > div > div {
+        background: rgba(45, 55, 72, 0.9) !important;
+        border: 1px solid rgba(212, 175, 55, 0.4) !important;
+        border-radius: 8px !important;
+        color: #f7fafc !important;
+        width: 100% !important;
+        box-sizing: border-box !important;
+    }
+    
+    .stTextInput > div > div > input {
+        background: rgba(45, 55, 72, 0.9) !important;
+        border: 1px solid rgba(212, 175, 55, 0.4) !important;
+        border-radius: 8px !important;
+        color: #f7fafc !important;
+        padding: 12px 16px !important;
+        width: 100% !important;
+        box-sizing: border-box !important;
+    }
+    
+    /* Mobile Form Adjustments */
+    @media (max-width: 640px) {
         .stSelectbox > div > div {
-            background: rgba(45, 55, 72, 0.9) !important;
-            border: 1px solid rgba(212, 175, 55, 0.4) !important;
-            border-radius: 8px !important;
-            color: #f7fafc !important;
-            width: 100% !important;
-            box-sizing: border-box !important;
+            font-size: 14px !important;
         }
         
         .stTextInput > div > div > input {
-            background: rgba(45, 55, 72, 0.9) !important;
-            border: 1px solid rgba(212, 175, 55, 0.4) !important;
-            border-radius: 8px !important;
-            color: #f7fafc !important;
-            padding: 12px 16px !important;
-            width: 100% !important;
-            box-sizing: border-box !important;
-        }
-        
-        /* Mobile Form Adjustments */
-        @media (max-width: 640px) {
-            .stSelectbox > div > div {
-                font-size: 14px !important;
-            }
-            
-            .stTextInput > div > div > input {
-                padding: 10px 12px !important;
-                font-size: 14px !important;
-            }
-            
-            .stButton > button {
-                width: 100% !important;
-                padding: 10px 16px !important;
-                font-size: 14px !important;
-            }
+            padding: 10px 12px !important;
+            font-size: 14px !important;
         }
         
-        .stTextInput > div > div > input:focus {
-            border-color: #d4af37 !important;
-            box-shadow: 0 0 0 2px rgba(212, 175, 55, 0.2) !important;
-        }
-        
-        /* Buttons */
         .stButton > button {
-            background: linear-gradient(135deg, #d4af37 0%, #b8941f 100%) !important;
-            border: none !important;
-            border-radius: 8px !important;
-            color: #1a1f2e !important;
-            font-weight: 600 !important;
-            padding: 12px 24px !important;
-            text-transform: uppercase;
-            letter-spacing: 0.02em;
-            font-size: 0.875rem;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 24px rgba(212, 175, 55, 0.4) !important;
-        }
-        
-        /* Responsive Restaurant Cards */
-        .stExpander {
-            background: rgba(45, 55, 72, 0.9) !important;
-            border: 1px solid rgba(212, 175, 55, 0.3) !important;
-            border-radius: 12px !important;
-            margin: 1rem 0 !important;
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.3) !important;
             width: 100% !important;
-            box-sizing: border-box !important;
+            padding: 10px 16px !important;
+            font-size: 14px !important;
         }
-        
-        /* Mobile Restaurant Card Adjustments */
-        @media (max-width: 640px) {
-            .stExpander {
-                margin: 0.5rem 0 !important;
-                border-radius: 8px !important;
-            }
-            
-            .stExpander > div:first-child {
-                font-size: 1rem !important;
-                padding: 12px !important;
-            }
+    }
+    
+    .stTextInput > div > div > input:focus {
+        border-color: #d4af37 !important;
+        box-shadow: 0 0 0 2px rgba(212, 175, 55, 0.2) !important;
+    }
+    
+    /* Buttons */
+    .stButton > button {
+        background: linear-gradient(135deg, #d4af37 0%, #b8941f 100%) !important;
+        border: none !important;
+        border-radius: 8px !important;
+        color: #1a1f2e !important;
+        font-weight: 600 !important;
+        padding: 12px 24px !important;
+        text-transform: uppercase;
+        letter-spacing: 0.02em;
+        font-size: 0.875rem;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px) !important;
+        box-shadow: 0 8px 24px rgba(212, 175, 55, 0.4) !important;
+    }
+    
+    /* Responsive Restaurant Cards */
+    .stExpander {
+        background: rgba(45, 55, 72, 0.9) !important;
+        border: 1px solid rgba(212, 175, 55, 0.3) !important;
+        border-radius: 12px !important;
+        margin: 1rem 0 !important;
+        box-shadow: 0 8px 24px rgba(0, 0, 0, 0.3) !important;
+        width: 100% !important;
+        box-sizing: border-box !important;
+    }
+    
+    /* Mobile Restaurant Card Adjustments */
+    @media (max-width: 640px) {
+        .stExpander {
+            margin: 0.5rem 0 !important;
+            border-radius: 8px !important;
         }
         
         .stExpander > div:first-child {
-            background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%) !important;
-            color: #ffffff !important;
-            font-weight: 600 !important;
-            font-family: 'Playfair Display', serif !important;
-            border-bottom: 1px solid rgba(212, 175, 55, 0.3) !important;
+            font-size: 1rem !important;
+            padding: 12px !important;
         }
-        
-        /* Responsive Info Sections */
+    }
+    
+    .stExpander > div:first-child {
+        background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%) !important;
+        color: #ffffff !important;
+        font-weight: 600 !important;
+        font-family: 'Playfair Display', serif !important;
+        border-bottom: 1px solid rgba(212, 175, 55, 0.3) !important;
+    }
+    
+    /* Responsive Info Sections */
+    .info-section {
+        background: rgba(45, 55, 72, 0.8);
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+        border: 1px solid rgba(212, 175, 55, 0.2);
+        width: 100%;
+        box-sizing: border-box;
+    }
+    
+    @media (max-width: 640px) {
         .info-section {
-            background: rgba(45, 55, 72, 0.8);
-            border-radius: 8px;
-            padding: 1rem;
-            margin: 1rem 0;
-            border: 1px solid rgba(212, 175, 55, 0.2);
-            width: 100%;
-            box-sizing: border-box;
-        }
-        
-        @media (max-width: 640px) {
-            .info-section {
-                padding: 0.75rem;
-                margin: 0.5rem 0;
-                border-radius: 6px;
-            }
-        }
-        
-        .section-header {
-            color: #ffffff;
-            font-size: 1.2rem;
-            font-weight: 600;
-            margin: 0 0 16px 0;
-            border-bottom: 2px solid #d4af37;
-            padding-bottom: 8px;
-            font-family: 'Playfair Display', serif;
-        }
-        
-        .detail-text {
-            color: #e2e8f0;
-            font-weight: 400;
-            line-height: 1.6;
-            font-family: 'Inter', sans-serif;
-            margin-bottom: 8px;
-        }
-        
-        .detail-text strong {
-            color: #ffffff;
-            font-weight: 600;
-        }
-        
-        /* Dividers */
-        .divider {
-            height: 1px;
-            background: linear-gradient(90deg, transparent 0%, rgba(212, 175, 55, 0.5) 50%, transparent 100%);
-            margin: 2rem 0;
-        }
-        
-        /* General Elements */
-        .stMarkdown {
-            color: #e2e8f0;
-            font-family: 'Inter', sans-serif;
-        }
-        
-        .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4 {
-            color: #ffffff;
-            font-family: 'Playfair Display', serif;
-        }
-        
-        .stCaption {
-            color: #a0aec0 !important;
-        }
-        
-        /* Hide Streamlit default elements */
-        div[data-testid="stToolbar"] {
-            display: none;
-        }
-        
-        /* Hide Streamlit header */
-        header[data-testid="stHeader"] {
-            display: none !important;
-        }
-        
-        /* Responsive Layout Adjustments */
-        [data-testid="stAppViewContainer"] {
-            padding-top: 0rem !important;
-            width: 100% !important;
+            padding: 0.75rem;
+            margin: 0.5rem 0;
+            border-radius: 6px;
         }
-        
-        /* Column Responsiveness */
+    }
+    
+    .section-header {
+        color: #ffffff;
+        font-size: 1.2rem;
+        font-weight: 600;
+        margin: 0 0 16px 0;
+        border-bottom: 2px solid #d4af37;
+        padding-bottom: 8px;
+        font-family: 'Playfair Display', serif;
+    }
+    
+    .detail-text {
+        color: #e2e8f0;
+        font-weight: 400;
+        line-height: 1.6;
+        font-family: 'Inter', sans-serif;
+        margin-bottom: 8px;
+    }
+    
+    .detail-text strong {
+        color: #ffffff;
+        font-weight: 600;
+    }
+    
+    /* Dividers */
+    .divider {
+        height: 1px;
+        background: linear-gradient(90deg, transparent 0%, rgba(212, 175, 55, 0.5) 50%, transparent 100%);
+        margin: 2rem 0;
+    }
+    
+    /* General Elements */
+    .stMarkdown {
+        color: #e2e8f0;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4 {
+        color: #ffffff;
+        font-family: 'Playfair Display', serif;
+    }
+    
+    .stCaption {
+        color: #a0aec0 !important;
+    }
+    
+    /* Hide Streamlit default elements */
+    div[data-testid="stToolbar"] {
+        display: none;
+    }
+    
+    /* Hide Streamlit header */
+    header[data-testid="stHeader"] {
+        display: none !important;
+    }
+    
+    /* Responsive Layout Adjustments */
+    [data-testid="stAppViewContainer"] {
+        padding-top: 0rem !important;
+        width: 100% !important;
+    }
+    
+    /* Column Responsiveness */
+    [data-testid="column"] {
+        width: 100% !important;
+        padding: 0 0.25rem !important;
+    }
+    
+    @media (max-width: 640px) {
         [data-testid="column"] {
-            width: 100% !important;
-            padding: 0 0.25rem !important;
+            min-width: 100% !important;
+            padding: 0.25rem 0 !important;
         }
         
-        @media (max-width: 640px) {
-            [data-testid="column"] {
-                min-width: 100% !important;
-                padding: 0.25rem 0 !important;
-            }
-            
-            /* Stack columns on mobile */
-            .row-widget {
-                flex-direction: column !important;
-            }
+        /* Stack columns on mobile */
+        .row-widget {
+            flex-direction: column !important;
         }
-        
-        /* Touch-friendly elements */
-        @media (max-width: 768px) {
-            .stButton > button, .stSelectbox, .stTextInput {
-                min-height: 44px !important; /* iOS recommended touch target */
-            }
+    }
+    
+    /* Touch-friendly elements */
+    @media (max-width: 768px) {
+        .stButton > button, .stSelectbox, .stTextInput {
+            min-height: 44px !important; /* iOS recommended touch target */
+        }
+    }
+</style>
+"""
+
+@st.cache_resource(show_spinner=False)
+def get_header_html():
+    """Header markup with the logo inlined, built once per process rather than per session"""
+    try:
+        with Image.open('attached_assets/Clean Plate_1754314259976.png') as logo:
+            # The logo is shown at 90px; encode it at 2x for high-DPI screens
+            # instead of inlining the 1 MB original on every rerun
+            logo.thumbnail((180, 180))
+            buffer = io.BytesIO()
+            logo.save(buffer, format='PNG', optimize=True)
+        logo_base64 = base64.b64encode(buffer.getvalue()).decode()
+        logo_html = f'<img src="data:image/png;base64,{logo_base64}" style="width: 90px; height: 90px; vertical-align: middle; margin-right: 16px; border-radius: 50%;" alt="CleanPlate Logo" />'
+    except FileNotFoundError:
+        # Fallback to emoji if logo file not found
+        logo_html = '<span style="font-size: 90px; vertical-align: middle; margin-right: 16px;">🍽️</span>'
+    return HEADER_TEMPLATE.format(logo_html=logo_html)
+
+@st.cache_resource(show_spinner=False)
+def get_api_client(jurisdiction):
+    """One API client per jurisdiction, shared by every session and its pooled HTTP connections"""
+    return HealthInspectionAPI(jurisdiction)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_jurisdictions():
+    """Supported jurisdictions; the list is static so it is built once"""
+    return HealthInspectionAPI().get_available_jurisdictions()
+
+# Persisted to disk so the lists survive restarts; Streamlit does not apply a TTL
+# to persisted caches, which is fine for borough/ward lists that practically never change
+@st.cache_data(persist="disk", show_spinner=False)
+def get_locations(jurisdiction):
+    """Boroughs/areas for a jurisdiction, which may need an API round-trip to discover"""
+    return get_api_client(jurisdiction).get_available_locations()
+
+@st.cache_data(show_spinner=False)
+def get_location_options(jurisdiction):
+    """Ready-made Borough/Area selectbox options, so reruns don't rebuild the list"""
+    return ("All", *get_locations(jurisdiction))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_jurisdiction_options():
+    """City selectbox labels in get_jurisdictions() order"""
+    return tuple(JURISDICTION_NAMES.get(j, j) for j in get_jurisdictions())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_grading_info(jurisdiction):
+    """Grading system description for a jurisdiction"""
+    return get_api_client(jurisdiction).get_grading_system_info()
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def fetch_restaurants(jurisdiction, location, search_term, grades, cuisines, limit=1000):
+    """Cached restaurant search; grades and cuisines must be tuples (or None) to be hashable"""
+    api_client = get_api_client(jurisdiction)
+    grades = list(grades) if grades else None
+    cuisines = list(cuisines) if cuisines else None
+    
+    # One query even for a whole city: the API orders and limits it globally, which
+    # per-borough queries can't do without fetching far more rows
+    restaurants_df = api_client.get_restaurants(
+        location=location,
+        search_term=search_term,
+        grades=grades,
+        cuisines=cuisines,
+        limit=limit
+    )
+    
+    # Sort newest-first on the parsed timestamps so the cached frame is already
+    # ordered; the stable sort keeps ties in fetch order and undated rows go last
+    if not restaurants_df.empty:
+        restaurants_df = restaurants_df.sort_values('inspection_ts', ascending=False, kind='mergesort', na_position='last')
+    return restaurants_df
+
+@st.cache_resource(show_spinner=False)
+def get_ingest_pool():
+    """Single background writer for fetched results, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest")
+
+@st.cache_resource(show_spinner=False)
+def get_failed_saves():
+    """Hashes of result sets whose background save failed, shared across sessions"""
+    return set()
+
+def _check_save(results_hash, failed_saves, future):
+    """Done-callback for a background save: log a failure and forget the hash so it is saved again"""
+    try:
+        saved = future.result()
+    except Exception:
+        logger.exception("Background save of result set %s raised", results_hash)
+        saved = False
+    if saved:
+        return
+    logger.warning("Background save of result set %s failed; it will be retried", results_hash)
+    # The save can fail before persist_results has stored its entry, so the hash
+    # is also remembered and its entry cleared again by the next save_results
+    failed_saves.add(results_hash)
+    persist_results.clear(results_hash, None)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def persist_results(results_hash, _restaurants_df):
+    """Bulk-save a result set; keyed only on its hash so repeat searches skip the database"""
+    records = _restaurants_df.to_dict('records')
+    violations_by_restaurant = {
+        record['id']: (split_violations(record['violations']), record.get('inspection_date'))
+        for record in records if record.get('violations')
+    }
+    # Hand the write to the ingest thread so the results render without
+    # waiting on the database; its single worker keeps the writes serialized.
+    # The worker has no script context, so failures are logged, not shown
+    future = get_ingest_pool().submit(save_restaurants_bulk, records, violations_by_restaurant)
+    future.add_done_callback(partial(_check_save, results_hash, get_failed_saves()))
+
+def save_results(results_hash, restaurants_df):
+    """Persist a result set unless it was already saved successfully"""
+    failed_saves = get_failed_saves()
+    if results_hash in failed_saves:
+        failed_saves.discard(results_hash)
+        persist_results.clear(results_hash, None)
+    persist_results(results_hash, restaurants_df)
+
+# Initialize session state
+if 'current_jurisdiction' not in st.session_state:
+    st.session_state.current_jurisdiction = "NYC"
+
+# Initialize database on startup
+init_database()
+
+def main():
+    grading_info = get_grading_info(st.session_state.current_jurisdiction)
+    
+    # Add Google AdSense verification meta tag using Streamlit's built-in method
+    st.html("""
+    <meta name="google-adsense-account" content="ca-pub-8384381342878857">
+    <style>
+        meta[name="google-adsense-account"] {
+            display: none !important;
+            visibility: hidden !important;
+            position: absolute !important;
+            left: -9999px !important;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """)
+
+    
+    # RESPONSIVE DESIGN - Optimized for all devices
+    st.markdown(APP_CSS, unsafe_allow_html=True)
     
     # Temporarily disabled advertisement display to fix core functionality
     # ad_manager.display_banner_ad("header")
     
     # Header with custom logo
-    logo_base64 = st.session_state.get('logo_base64', '')
-    if logo_base64:
-        logo_html = f'<img src="data:image/png;base64,{logo_base64}" style="width: 90px; height: 90px; vertical-align: middle; margin-right: 16px; border-radius: 50%;" alt="CleanPlate Logo" />'
-    else:
-        logo_html = '<span style="font-size: 90px; vertical-align: middle; margin-right: 16px;">🍽️</span>'
-    
-    st.markdown(f"""
-    <div class="main-header">
-        <h1>
-            {logo_html}
-            CleanPlate
-        </h1>
-        <p>Peeking behind the kitchen door, so you can dine without doubt. We dish out health inspection scores, making informed choices deliciously easy.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(get_header_html(), unsafe_allow_html=True)
     
     # Display header ad for revenue generation
     ad_manager.display_banner_ad("header")
@@ -389,81 +551,58 @@ def main():
     col_juris, col_search, col_location = st.columns([1, 2, 1])
     
     with col_juris:
-        jurisdictions = st.session_state.api_client.get_available_jurisdictions()
-        jurisdiction_names = {
-            "NYC": "New York City, NY", 
-            "Chicago": "Chicago, IL",
-            "Boston": "Boston, MA",
-            "Austin": "Austin, TX", 
-            "Seattle": "Seattle, WA",
-            "Detroit": "Detroit, MI",
-            "Los Angeles": "Los Angeles, CA"
-        }
-        jurisdiction_options = [jurisdiction_names.get(j, j) for j in jurisdictions]
+        jurisdiction_options = get_jurisdiction_options()
         
-        selected_jurisdiction_display = st.selectbox(
+        # Switching happens in the on_change callback, before the rerun,
+        # so no extra st.rerun() round-trip is needed
+        st.selectbox(
             "City", 
             jurisdiction_options,
-            index=jurisdiction_options.index(jurisdiction_names[st.session_state.current_jurisdiction])
+            index=jurisdiction_options.index(JURISDICTION_NAMES[st.session_state.current_jurisdiction]),
+            key="jurisdiction_display",
+            on_change=on_jurisdiction_change
         )
         
-        reverse_map = {v: k for k, v in jurisdiction_names.items()}
-        selected_jurisdiction = reverse_map.get(selected_jurisdiction_display, "NYC")
-        
-        if selected_jurisdiction != st.session_state.current_jurisdiction:
-            # Clean up any existing database connections before switching
-            try:
-                from database import engine
-                engine.dispose()  # Close all existing connections
-            except:
-                pass  # Ignore cleanup errors
-            
-            st.session_state.current_jurisdiction = selected_jurisdiction
-            st.session_state.api_client.set_jurisdiction(selected_jurisdiction)
-            st.rerun()
-        
-        grading_info = st.session_state.api_client.get_grading_system_info()
         if grading_info.get('type') == 'letter':
             st.caption("Letter Grade System (A, B, C)")
         elif grading_info.get('type') == 'pass_fail':
             st.caption("Pass/Fail System")
     
-    # Advanced Search Section
-    with st.expander("🔍 Advanced Search Options", expanded=False):
-        st.markdown("**Refine your search with these advanced filters:**")
+    # Filters and search share one form, so changing them doesn't rerun the
+    # script until SEARCH is pressed (Enter in the search box also submits)
+    with st.form(key="search_form", clear_on_submit=False):
+        # Advanced Search Section
+        with st.expander("🔍 Advanced Search Options", expanded=False):
+            st.markdown("**Refine your search with these advanced filters:**")
         
-        col_search_mode, col_grade_filter = st.columns(2)
+            col_search_mode, col_grade_filter = st.columns(2)
         
-        with col_search_mode:
-            search_mode = st.radio(
-                "Search Mode",
-                ["Contains (partial match)", "Exact words", "Starts with"],
-                help="Choose how to match your search terms"
-            )
-        
-        with col_grade_filter:
-            grading_info = st.session_state.api_client.get_grading_system_info()
-            if grading_info.get('grades'):
-                grade_options = ["All Grades"] + list(grading_info['grades'].keys())
-                grade_filter = st.selectbox(
-                    "Grade Filter",
-                    grade_options,
-                    help="Filter by health inspection grade"
+            with col_search_mode:
+                search_mode = st.radio(
+                    "Search Mode",
+                    ["Contains (partial match)", "Exact words", "Starts with"],
+                    help="Choose how to match your search terms"
                 )
-                grade_filter = None if grade_filter == "All Grades" else [grade_filter]
-            else:
-                grade_filter = None
         
-        # Cuisine filter
-        cuisine_filter = st.multiselect(
-            "Cuisine Types",
-            ["Italian", "Chinese", "Mexican", "American", "Japanese", "Thai", "Indian", "Mediterranean", "French", "Korean"],
-            help="Filter by cuisine type (optional)"
-        )
-        cuisine_filter = None if not cuisine_filter else cuisine_filter
+            with col_grade_filter:
+                if grading_info.get('grades'):
+                    grade_filter = st.selectbox(
+                        "Grade Filter",
+                        ("All Grades", *grading_info['grades']),
+                        help="Filter by health inspection grade"
+                    )
+                    grade_filter = None if grade_filter == "All Grades" else [grade_filter]
+                else:
+                    grade_filter = None
+        
+            # Cuisine filter
+            cuisine_filter = st.multiselect(
+                "Cuisine Types",
+                CUISINE_OPTIONS,
+                help="Filter by cuisine type (optional)"
+            )
+            cuisine_filter = None if not cuisine_filter else cuisine_filter
 
-    # Create a form to enable Enter key submission
-    with st.form(key="search_form", clear_on_submit=False):
         col_search_form, col_location_form, col_button_form = st.columns([2, 1, 0.5])
         
         with col_search_form:
@@ -475,10 +614,9 @@ def main():
             )
         
         with col_location_form:
-            locations = st.session_state.api_client.get_available_locations()
             location_filter = st.selectbox(
                 "Borough/Area",
-                ["All"] + locations,
+                get_location_options(st.session_state.current_jurisdiction),
                 key="location_select"
             )
             location_filter = None if location_filter == "All" else location_filter
@@ -487,74 +625,138 @@ def main():
             st.write("")  # Add spacing
             search_clicked = st.form_submit_button("SEARCH", use_container_width=True)
 
+    if search_clicked:
+        # Apply advanced search filtering
+        processed_search_term = search_term
+        if search_term and search_mode:
+            if search_mode == "Exact words":
+                # For exact word matching, wrap in quotes or use exact match logic
+                processed_search_term = f'"{search_term}"' if search_term else search_term
+            elif search_mode == "Starts with":
+                # Add prefix matching indicator
+                processed_search_term = f"{search_term}*" if search_term else search_term
+        
+        # Resubmitting the query already on screen keeps the prepared results
+        # instead of re-hashing, re-saving and re-deduplicating them
+        results_key = (
+            st.session_state.current_jurisdiction,
+            location_filter,
+            processed_search_term,
+            tuple(grade_filter) if grade_filter else None,
+            tuple(cuisine_filter) if cuisine_filter else None
+        )
+        if st.session_state.get('search_results') and st.session_state.get('results_key') == results_key:
+            search_clicked = False
+
     if search_clicked:
         # Show loading spinner while searching
         with st.spinner("🔍 Searching for results..."):
             try:
-                # Apply advanced search filtering
-                processed_search_term = search_term
-                if search_term and search_mode:
-                    if search_mode == "Exact words":
-                        # For exact word matching, wrap in quotes or use exact match logic
-                        processed_search_term = f'"{search_term}"' if search_term else search_term
-                    elif search_mode == "Starts with":
-                        # Add prefix matching indicator
-                        processed_search_term = f"{search_term}*" if search_term else search_term
-                
-                restaurants_df = st.session_state.api_client.get_restaurants(
-                    location=location_filter,
-                    search_term=processed_search_term,
-                    grades=grade_filter,
-                    cuisines=cuisine_filter,
-                    limit=1000
-                )
+                restaurants_df = fetch_restaurants(*results_key)
                 
                 if restaurants_df.empty:
+                    st.session_state.pop('search_results', None)
                     st.warning("No restaurants found matching your criteria. Please adjust your filters.")
                     return
                 
-                # Save to database
-                for _, restaurant in restaurants_df.iterrows():
-                    restaurant_data = restaurant.to_dict()
-                    violations = restaurant_data.pop('violations', [])
-                    save_restaurant_to_db(restaurant_data, violations)
+                # Save to database once per unique result set, across sessions and reruns
+                results_hash = int(pd.util.hash_pandas_object(
+                    restaurants_df.drop(columns=['inspections'], errors='ignore'), index=False
+                ).sum())
+                save_results(results_hash, restaurants_df)
                 
 
-                
                 # Temporarily disabled sponsored restaurant display to fix HTML rendering issue
                 # ad_manager.display_sponsored_restaurant()
                 
-                # Deduplicate restaurants to show only the most recent inspection per establishment
+                # Deduplicate restaurants to show only the most recent inspection per establishment;
+                # rows arrive newest-first, so the first one seen for a key is the one to keep
                 latest_inspections = {}
-                for _, restaurant in restaurants_df.iterrows():
+                for restaurant in restaurants_df.to_dict('records'):
                     name = restaurant.get('name', 'Unknown')
                     address = restaurant.get('address', '')
                     restaurant_key = f"{name}|{address}".lower()
-                    
-                    # Keep only the most recent inspection for each restaurant
-                    if restaurant_key not in latest_inspections:
-                        latest_inspections[restaurant_key] = restaurant
-                    else:
-                        # Compare dates and keep the more recent one
-                        current_date = latest_inspections[restaurant_key].get('inspection_date', '')
-                        new_date = restaurant.get('inspection_date', '')
-                        if new_date > current_date:
-                            latest_inspections[restaurant_key] = restaurant
-                
-                # Convert back to DataFrame for display
-                unique_restaurants = list(latest_inspections.values())
+                    latest_inspections.setdefault(restaurant_key, restaurant)
                 
-                st.subheader(f"Showing {len(unique_restaurants)} unique restaurants (most recent inspection only)")
-                
-                # Display unique restaurants
-                for restaurant in sorted(unique_restaurants, key=lambda x: x.get('inspection_date', ''), reverse=True):
-                    display_restaurant_card(restaurant)
-                    
+                # Keep results across reruns so paging doesn't require a new search
+                st.session_state.search_results = list(latest_inspections.values())
+                st.session_state.results_key = results_key
+                st.session_state.results_page = 1
+
             except Exception as e:
                 st.error(f"Error loading restaurant data: {str(e)}")
                 st.info("Please check your internet connection and try again.")
+                return
+
+    search_results = st.session_state.get('search_results')
+    if search_results:
+        st.subheader(f"Showing {len(search_results)} unique restaurants (most recent inspection only)")
+        display_results_page(search_results)
+
+def on_jurisdiction_change():
+    """Switch the API client to the city picked in the City selectbox"""
+    selected_jurisdiction = JURISDICTION_CODES.get(st.session_state.jurisdiction_display, "NYC")
+    if selected_jurisdiction == st.session_state.current_jurisdiction:
+        return
+    
+    st.session_state.current_jurisdiction = selected_jurisdiction
+    # Results from the previous city no longer match the active grading system
+    st.session_state.pop('search_results', None)
+
+@st.fragment
+def display_results_page(restaurants):
+    """Render the results as a table or one page of cards; as a fragment, paging reruns only this function"""
+    view_mode = st.radio(
+        "View",
+        ["Cards", "Table"],
+        index=1 if len(restaurants) > TABLE_VIEW_THRESHOLD else 0,
+        horizontal=True,
+        key="results_view"
+    )
+    if view_mode == "Table":
+        display_results_table(restaurants)
+        return
+    
+    total_pages = max(1, (len(restaurants) + RESULTS_PAGE_SIZE - 1) // RESULTS_PAGE_SIZE)
+    page = 1
+    if total_pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=total_pages, step=1, key="results_page")
+        st.caption(f"Page {page} of {total_pages}")
+
+    start = (page - 1) * RESULTS_PAGE_SIZE
+    page_restaurants = restaurants[start:start + RESULTS_PAGE_SIZE]
+    
+    # Only a handful of distinct grades appear per page, so look each one up once
+    page_grades = {restaurant.get('grade', 'Not Yet Graded') for restaurant in page_restaurants}
+    for restaurant in page_restaurants:
+        page_grades.update(inspection.get('grade', 'Not Graded') for inspection in restaurant.get('inspections', [])[:5])
+    api_client = get_api_client(st.session_state.current_jurisdiction)
+    grade_info_map = {grade: api_client.get_grade_info(grade) for grade in page_grades}
+    # Timeline badges depend only on the grade, so render each one once per page
+    grade_badge_map = {grade: TIMELINE_GRADE_BADGE_TEMPLATE.format_map(info).strip() for grade, info in grade_info_map.items()}
+    
+    for restaurant in page_restaurants:
+        display_restaurant_card(restaurant, grade_info_map, grade_badge_map)
+
+def display_results_table(restaurants):
+    """Show every result in one virtualized st.dataframe instead of rendering cards"""
+    results_df = pd.DataFrame(restaurants, columns=RESULTS_TABLE_COLUMNS)
+    st.dataframe(
+        results_df,
+        column_config={
+            'name': st.column_config.TextColumn("Restaurant"),
+            'grade': st.column_config.TextColumn("Grade"),
+            'score': st.column_config.NumberColumn("Score"),
+            'inspection_ts': st.column_config.DateColumn("Last Inspected", format="MMM D, YYYY"),
+            'address': st.column_config.TextColumn("Address"),
+            'cuisine_type': st.column_config.TextColumn("Cuisine"),
+            'boro': st.column_config.TextColumn("Location"),
+        },
+        use_container_width=True,
+        hide_index=True
+    )
 
-def display_restaurant_card(restaurant):
+def display_restaurant_card(restaurant, grade_info_map, grade_badge_map):
     """Display restaurant card with sophisticated multi-inspection timeline"""
     
     # Handle both old and new data formats
@@ -565,7 +767,7 @@ def display_restaurant_card(restaurant):
             'grade': restaurant.get('grade', 'Not Yet Graded'),
             'score': restaurant.get('score'),
             'inspection_date': restaurant.get('inspection_date', 'N/A'),
-            'violations': restaurant.get('violations', []),
+            'violations': split_violations(restaurant.get('violations')),
             'inspection_type': restaurant.get('inspection_type', ''),
             'critical_flag': restaurant.get('critical_flag', '')
         }]
@@ -576,7 +778,7 @@ def display_restaurant_card(restaurant):
     # Create more prominent restaurant header
     restaurant_name = restaurant['name']
     grade = restaurant.get('grade', 'Not Yet Graded')
-    grade_info = st.session_state.api_client.get_grade_info(grade)
+    grade_info = grade_info_map[grade]
     
     # Create prominent restaurant header using native Streamlit components
     st.markdown(f"# {restaurant_name}")
@@ -587,23 +789,18 @@ def display_restaurant_card(restaurant):
     
     col_grade, col_spacer = st.columns([1, 2])
     with col_grade:
-        if grade_label == 'A':
-            st.success(f"Grade: {grade_label} - {grade_desc}")
-        elif grade_label == 'B':
-            st.warning(f"Grade: {grade_label} - {grade_desc}")
-        elif grade_label == 'C':
-            st.error(f"Grade: {grade_label} - {grade_desc}")
-        else:
-            st.info(f"Grade: {grade_label} - {grade_desc}")
+        GRADE_ALERTS.get(grade_label, st.info)(f"Grade: {grade_label} - {grade_desc}")
 
     with st.expander("📋 Restaurant Details & Order Food", expanded=True):
         
         col1, col2 = st.columns([2, 1])
         with col1:
-            st.subheader("📍 Restaurant Information")
-            st.write(f"**Address:** {restaurant.get('address', 'N/A')}")
-            st.write(f"**Cuisine:** {restaurant.get('cuisine_type', 'Not specified')}")
-            st.write(f"**Location:** {restaurant.get('boro', 'N/A')}")
+            st.markdown(
+                "### 📍 Restaurant Information\n"
+                f"**Address:** {restaurant.get('address', 'N/A')}  \n"
+                f"**Cuisine:** {restaurant.get('cuisine_type', 'Not specified')}  \n"
+                f"**Location:** {restaurant.get('boro', 'N/A')}"
+            )
         
         with col2:
             # Add delivery affiliate buttons for revenue generation
@@ -614,79 +811,50 @@ def display_restaurant_card(restaurant):
         
         # Inspection History Timeline - Using native Streamlit components
         if len(inspections) > 1:
-            st.subheader("📋 Inspection History Timeline")
-            
-            for i, inspection in enumerate(inspections[:5]):  # Show up to 5 most recent
+            timeline = inspections[:5]  # Show up to 5 most recent
+            timeline_html = []
+            for i, inspection in enumerate(timeline):
                 inspection_date = inspection.get("inspection_date", "Date not available")
                 if inspection_date and inspection_date != "Date not available":
-                    from utils import format_inspection_date
                     formatted_date = format_inspection_date(inspection_date)
                 else:
                     formatted_date = inspection_date
                 
-                grade = inspection.get('grade', 'Not Graded')
-                grade_info = st.session_state.api_client.get_grade_info(grade)
                 score = inspection.get('score')
-                inspection_type = inspection.get('inspection_type', 'Regular Inspection')
-                
-                # Use native Streamlit components instead of raw HTML
-                timeline_icon = "🔸" if i == 0 else "🔹"
-                
-                # Create timeline entry using columns
-                col_icon, col_content = st.columns([0.1, 0.9])
-                
-                with col_icon:
-                    st.write(timeline_icon)
-                
-                with col_content:
-                    # Date and grade in same row
-                    date_col, grade_col = st.columns([0.7, 0.3])
-                    
-                    with date_col:
-                        st.write(f"**{formatted_date}**")
-                        st.caption(f"Type: {inspection_type}" + (f" | Score: {score}" if score else ""))
-                    
-                    with grade_col:
-                        # Display grade badge using native Streamlit
-                        st.markdown(f"""
-                        <div style="background: {grade_info['color']}20; border: 1px solid {grade_info['color']}; 
-                                   border-radius: 5px; padding: 5px 10px; text-align: center;">
-                            <span style="color: {grade_info['color']}; font-weight: bold; font-size: 0.9rem;">
-                                {grade_info['label']}
-                            </span>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Add separator between entries
-                if i < min(len(inspections) - 1, 4):
-                    st.markdown("---")
+                timeline_html.append(TIMELINE_ENTRY_TEMPLATE.format(
+                    icon="🔸" if i == 0 else "🔹",
+                    date=escape(str(formatted_date)),
+                    inspection_type=escape(str(inspection.get('inspection_type', 'Regular Inspection'))),
+                    score_text=f" | Score: {score}" if score else "",
+                    badge=grade_badge_map[inspection.get('grade', 'Not Graded')],
+                    separator=TIMELINE_SEPARATOR_STYLE if i < len(timeline) - 1 else ""
+                ))
+            st.markdown("### 📋 Inspection History Timeline\n\n" + ''.join(timeline_html), unsafe_allow_html=True)
             
             if len(inspections) > 5:
                 st.caption(f"... and {len(inspections) - 5} more inspections")
         
-        # Latest Inspection Details
+        # Latest Inspection Details; the heading shares a markdown element with the violations
         latest_date = latest_inspection.get("inspection_date", "Date not available")
         if latest_date and latest_date != "Date not available":
-            from utils import format_inspection_date
-            formatted_latest_date = format_inspection_date(latest_date)
-            st.subheader(f"🔍 Latest Inspection - {formatted_latest_date}")
+            latest_heading = f"### 🔍 Latest Inspection - {format_inspection_date(latest_date)}"
         else:
-            st.subheader("🔍 Latest Inspection Results")
+            latest_heading = "### 🔍 Latest Inspection Results"
         
-        if 'violations' in latest_inspection and latest_inspection['violations']:
-            violations = [v for v in latest_inspection['violations'] if v != "No violations recorded"]
-            if violations:
-                for i, violation in enumerate(violations[:3]):
-                    st.write(f"• {violation}")
-                
-                if len(violations) > 3:
-                    with st.expander(f"View {len(violations) - 3} more violations from latest inspection"):
-                        for violation in violations[3:]:
-                            st.write(f"• {violation}")
-            else:
-                st.success("✓ No violations recorded")
+        violations = [v for v in latest_inspection.get('violations') or [] if v != "No violations recorded"]
+        if violations:
+            st.markdown(latest_heading + "\n\n" + violations_markdown(violations[:3]))
+            
+            if len(violations) > 3:
+                with st.expander(f"View {len(violations) - 3} more violations from latest inspection"):
+                    st.markdown(violations_markdown(violations[3:]))
         else:
+            st.markdown(latest_heading)
             st.success("✓ No violations recorded")
 
+def violations_markdown(violations):
+    """Markdown bullet list of violation texts, sent as a single element"""
+    return "\n".join(f"- {violation}" for violation in violations)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
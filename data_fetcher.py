@@ -1,8 +1,144 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import os
-from datetime import datetime, timedelta
+import sys
+import time
+import hashlib
+import pickle
+import sqlite3
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from contextlib import closing, contextmanager
+from itertools import islice
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+except ImportError:  # optional faster parser; the stdlib one works the same way
+    orjson = None
+
+# Parses raw response bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_parse_json = orjson.loads if orjson else json.loads
+
+# Restaurant violations are stored in one string column, joined with this separator
+VIOLATION_SEPARATOR = '\t'
+
+# Chicago reports pass/fail results; these are the results each NYC-style grade filter selects.
+# Chicago's own result values are not listed here and filter on themselves
+CHICAGO_RESULTS_BY_GRADE = {
+    "A": ("Pass", "Pass w/ Conditions"),
+    "B": ("Pass w/ Conditions",),
+    "C": ("Fail", "Out of Business"),
+    "Grade Pending": ("Not Ready",),
+    "Not Yet Graded": ("Not Ready",),
+}
+
+def split_violations(violations_text):
+    """Turn a joined violations string from a results DataFrame back into a list"""
+    return violations_text.split(VIOLATION_SEPARATOR) if violations_text else []
+
+def _nyc_violations(description, critical_flag, code):
+    """Violation lines for one NYC inspection row; arguments are '' when the field is missing"""
+    violations = []
+    if description:
+        violations.append(description)
+    if critical_flag == 'Y':
+        violations.append("Critical violation found")
+    if code:
+        violations.append("Violation code: " + code)
+    return violations or ["No violations recorded"]
+
+def _chicago_violations(violation_text):
+    """Violation lines from Chicago's single '|'/newline-delimited violations field"""
+    violations = [part.strip() for part in violation_text.replace('|', '\n').split('\n') if part.strip()]
+    return violations or ["No violations recorded"]
+
+def soql_quote(value):
+    """Quote a value as a SoQL/SQL string literal, doubling embedded single quotes"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def in_condition(field, values):
+    """WHERE condition matching any of the given values, e.g. cuisine_description in('Thai','Indian')"""
+    return f"{field} in(" + ",".join(soql_quote(value) for value in values) + ")"
+
+def date_range_condition(field, date_range):
+    """WHERE condition for an inclusive (start, end) date range"""
+    start_date, end_date = (day.strftime('%Y-%m-%d') for day in date_range)
+    return f"{field} >= {soql_quote(start_date)} AND {field} <= {soql_quote(end_date)}"
+
+def name_match_condition(field, search_term):
+    """WHERE condition for the search modes: "exact" in quotes, prefix* with a trailing star, otherwise contains"""
+    if search_term.startswith('"') and search_term.endswith('"'):
+        # Exact word matching
+        return f"UPPER({field}) = " + soql_quote(search_term.strip('"').upper())
+    if search_term.endswith('*'):
+        # Starts with matching
+        return f"UPPER({field}) LIKE " + soql_quote(search_term.rstrip('*').upper() + '%')
+    # Contains matching (default)
+    return f"UPPER({field}) LIKE " + soql_quote('%' + search_term.upper() + '%')
+
+logger = logging.getLogger(__name__)
+
+# Search results are also kept on disk so new processes (restarts, other workers)
+# reuse recent API responses instead of repeating them; the path is fixed next to
+# this module so the cache never depends on the working directory
+SEARCH_CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'search_cache.sqlite3')
+
+def _memoize_hashable(func):
+    """lru_cache a one-argument function, calling it directly for unhashable values"""
+    cached = lru_cache(maxsize=4096)(func)
+
+    @wraps(func)
+    def wrapper(value):
+        try:
+            hash(value)
+        except TypeError:
+            return func(value)
+        return cached(value)
+
+    return wrapper
+
+class _CappedRetry(Retry):
+    """Retry policy whose Retry-After waits are bounded like its backoff"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+# Shared HTTP session so every client reuses pooled keep-alive connections
+# instead of paying a TCP+TLS handshake per API call
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.headers.update({
+    'User-Agent': 'Restaurant-Health-Inspector/1.0',
+    'Accept': 'application/json',
+    # Socrata compresses JSON several-fold; pin every encoding urllib3 can decode
+    # here (gzip and deflate, plus br/zstd when brotli or zstandard is installed)
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+})
+_SHARED_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    # Connection errors, read timeouts, rate limiting and transient gateway errors
+    # are all retried here with backoff, so callers make a single request; a 429's
+    # Retry-After header is honored, so throttled calls wait only as long as asked.
+    # Both the exponential backoff and any Retry-After wait are capped at a minute, and
+    # the backoff is jittered so the parallel page fetches don't retry in lockstep
+    max_retries=_CappedRetry(
+        total=3, connect=2, read=2,
+        backoff_factor=1, backoff_max=60, backoff_jitter=0.5,
+        status_forcelist=(429, 502, 503, 504), raise_on_status=False
+    )
+))
+
+# Worker pool for the pages of one paginated query
+_PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="page")
 
 class HealthInspectionAPI:
     """
@@ -132,23 +268,29 @@ class HealthInspectionAPI:
                 }
             },
             "Detroit": {
-                "base_url": "https://data.detroitmi.gov/resource/kpnp-cx36.json",
+                "base_url": "https://services2.arcgis.com/qvkbeam7Wirps6zC/arcgis/rest/services/Restaurant_Inspections/FeatureServer/0/query",
                 "name": "Detroit, MI",
-                "location_field": "address",
-                "grade_field": "inspection_result",
-                "name_field": "business_name",
-                "address_fields": ["address", "city", "state", "zip"],
+                "location_field": "ZIP_CODE",
+                "grade_field": "COMPLIANCE_STATUS",
+                "name_field": "FACILITY_NAME",
+                "address_fields": ["ADDRESS", "CITY", "STATE", "ZIP_CODE"],
                 "grading_system": {
-                    "type": "pass_fail",
+                    "type": "compliance",
                     "grades": {
-                        "Pass": {"label": "Pass", "description": "Excellent - Meets all health and safety requirements", "color": "#22c55e", "priority": "low"},
-                        "Conditional Pass": {"label": "Conditional", "description": "Good - Minor issues noted, corrective actions required", "color": "#f59e0b", "priority": "medium"},
-                        "Fail": {"label": "Fail", "description": "Critical - Serious violations requiring immediate attention", "color": "#ef4444", "priority": "high"},
-                        "No Entry": {"label": "No Entry", "description": "Inspection attempted but access denied", "color": "#6b7280", "priority": "medium"},
-                        "Not Inspected": {"label": "Not Inspected", "description": "Scheduled but not yet completed", "color": "#6b7280", "priority": "medium"}
+                        "In Compliance": {"label": "In Compliance", "description": "Excellent - Meets all Detroit health standards with no priority violations", "color": "#22c55e", "priority": "low"},
+                        "Out of Compliance": {"label": "Out of Compliance", "description": "Critical - Priority violations requiring immediate correction", "color": "#ef4444", "priority": "high"},
+                        "Enforcement": {"label": "Enforcement", "description": "Serious - Under enforcement action due to repeated violations", "color": "#dc2626", "priority": "high"},
+                        "Closed": {"label": "Closed", "description": "Establishment closed due to serious health violations", "color": "#991b1b", "priority": "high"},
+                        "Pending": {"label": "Pending", "description": "Recently inspected or awaiting compliance determination", "color": "#6b7280", "priority": "medium"}
                     },
                     "score_system": False,
-                    "score_description": "Detroit uses pass/fail system with conditional status for minor violations"
+                    "violation_system": True,
+                    "violation_types": {
+                        "Priority": {"label": "Priority", "description": "Critical violations that could directly cause foodborne illness", "color": "#ef4444"},
+                        "Priority Foundation": {"label": "Priority Foundation", "description": "Support practices for priority violations", "color": "#f59e0b"},
+                        "Core": {"label": "Core", "description": "General sanitation and operational violations", "color": "#6b7280"}
+                    },
+                    "score_description": "Detroit uses compliance-based system: In Compliance (green placard), Out of Compliance/Enforcement (red placard), with violation categorization"
                 }
             },
             "Los Angeles": {
@@ -169,101 +311,69 @@ class HealthInspectionAPI:
                     "score_system": True,
                     "score_description": "Letter grade system with numerical scores: Grade reflects overall compliance with LA County health regulations"
                 }
-            },
-            "Detroit": {
-                "base_url": "https://services2.arcgis.com/qvkbeam7Wirps6zC/arcgis/rest/services/Restaurant_Inspections/FeatureServer/0/query",
-                "name": "Detroit, MI",
-                "location_field": "ZIP_CODE",
-                "grade_field": "COMPLIANCE_STATUS",
-                "name_field": "FACILITY_NAME",
-                "address_fields": ["ADDRESS", "CITY", "STATE", "ZIP_CODE"],
-                "grading_system": {
-                    "type": "compliance",
-                    "grades": {
-                        "In Compliance": {"label": "In Compliance", "description": "Excellent - Meets all Detroit health standards with no priority violations", "color": "#22c55e", "priority": "low"},
-                        "Out of Compliance": {"label": "Out of Compliance", "description": "Critical - Priority violations requiring immediate correction", "color": "#ef4444", "priority": "high"},
-                        "Enforcement": {"label": "Enforcement", "description": "Serious - Under enforcement action due to repeated violations", "color": "#dc2626", "priority": "high"},
-                        "Closed": {"label": "Closed", "description": "Establishment closed due to serious health violations", "color": "#991b1b", "priority": "high"},
-                        "Pending": {"label": "Pending", "description": "Recently inspected or awaiting compliance determination", "color": "#6b7280", "priority": "medium"}
-                    },
-                    "score_system": False,
-                    "violation_system": True,
-                    "violation_types": {
-                        "Priority": {"label": "Priority", "description": "Critical violations that could directly cause foodborne illness", "color": "#ef4444"},
-                        "Priority Foundation": {"label": "Priority Foundation", "description": "Support practices for priority violations", "color": "#f59e0b"},
-                        "Core": {"label": "Core", "description": "General sanitation and operational violations", "color": "#6b7280"}
-                    },
-                    "score_description": "Detroit uses compliance-based system: In Compliance (green placard), Out of Compliance/Enforcement (red placard), with violation categorization"
-                }
             }
         }
         
         self.current_jurisdiction = jurisdiction
         self.current_api = self.apis.get(jurisdiction, self.apis["NYC"])
+        self._session = _SHARED_SESSION
         
         # Performance optimization caches
+        # Entries are (value, expiry) pairs keyed on canonical parameters plus _cache_version
         self._location_cache = {}
-        self._data_cache = {}
-        self._cache_timestamp = None
         self._cache_duration = 1800  # 30 minute cache for faster responses
+        self._search_cache_duration = 300  # 5 minute cache for searches
         self._search_cache = {}  # Cache for search results
-        self._restaurant_cache = {}  # Long-term restaurant cache
-        self._processing_batch_size = 10000  # Larger batch processing
+        self._cache_version = 0
         self._max_records_per_request = 60000  # Increased record limit
+        # Scalar text columns converted to Arrow strings; list columns (violations, inspections) stay as objects
+        self._text_columns = ('id', 'name', 'address', 'inspection_date', 'phone')
+        # Low-cardinality text columns (a handful of grades, boroughs, cuisines) are stored as categories
+        self._category_columns = ('cuisine_type', 'grade', 'boro', 'inspection_type')
     
     def _make_api_request(self, endpoint, params=None):
-        """Make API request with enhanced error handling and retries"""
-        import time
-        
-        max_retries = 3
-        retry_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                headers = {
-                    'User-Agent': 'Restaurant-Health-Inspector/1.0',
-                    'Accept': 'application/json'
-                }
-                
-                # Add King County API authentication for Seattle data
-                if 'kingcounty.gov' in endpoint:
-                    import os
-                    api_key = os.getenv('KING_COUNTY_API_KEY')
-                    app_token = os.getenv('KING_COUNTY_APP_TOKEN')
-                    
-                    if api_key:
-                        headers['X-API-Key'] = api_key
-                    if app_token:
-                        headers['X-App-Token'] = app_token
-                        if params:
-                            params['$$app_token'] = app_token
-                        else:
-                            params = {'$$app_token': app_token}
-                
-                response = requests.get(
-                    endpoint, 
-                    params=params, 
-                    headers=headers, 
-                    timeout=60,  # Increased timeout
-                    verify=True
-                )
-                response.raise_for_status()
-                return response.json()
+        """Make an API request on the shared session; retries are handled by its adapter"""
+        # User-Agent and Accept are session defaults; only auth headers vary per endpoint
+        headers = {}
+        
+        # An app token raises the Socrata rate limits; King County sets its own below
+        socrata_token = os.getenv('SOCRATA_APP_TOKEN')
+        if socrata_token and '/resource/' in endpoint:
+            headers['X-App-Token'] = socrata_token
+        
+        # Add King County API authentication for Seattle data
+        if 'kingcounty.gov' in endpoint:
+            api_key = os.getenv('KING_COUNTY_API_KEY')
+            app_token = os.getenv('KING_COUNTY_APP_TOKEN')
             
-            except requests.exceptions.Timeout:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                raise Exception("Request timed out after multiple attempts")
-            except requests.exceptions.ConnectionError:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                raise Exception("Connection failed - please check your internet connection")
-            except requests.exceptions.RequestException as e:
-                raise Exception(f"API request failed: {str(e)}")
-            except json.JSONDecodeError as e:
-                raise Exception(f"Invalid API response format: {str(e)}")
+            if api_key:
+                headers['X-API-Key'] = api_key
+            if app_token:
+                headers['X-App-Token'] = app_token
+                if params:
+                    params['$$app_token'] = app_token
+                else:
+                    params = {'$$app_token': app_token}
+        
+        try:
+            response = self._session.get(
+                endpoint, 
+                params=params, 
+                headers=headers, 
+                timeout=60,  # Increased timeout
+                verify=True
+            )
+            response.raise_for_status()
+            return _parse_json(response.content)
+        
+        except requests.exceptions.Timeout:
+            raise Exception("Request timed out after multiple attempts")
+        except requests.exceptions.ConnectionError:
+            raise Exception("Connection failed - please check your internet connection")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API request failed: {str(e)}")
+        except json.JSONDecodeError as e:
+            raise Exception(f"Invalid API response format: {str(e)}")
     
     def set_jurisdiction(self, jurisdiction):
         """Switch to a different jurisdiction"""
@@ -306,17 +416,94 @@ class HealthInspectionAPI:
         """Get current jurisdiction's grading system information"""
         return self.current_api.get("grading_system", {})
     
-    def _is_cache_valid(self):
-        """Check if cache is still valid"""
-        if self._cache_timestamp is None:
-            return False
-        return (datetime.now() - self._cache_timestamp).seconds < self._cache_duration
+    def _cache_get(self, cache, cache_key):
+        """Return a cached value, or None if it is missing or expired (expired entries are evicted)"""
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            # The client is shared across sessions and threads, so another one may have evicted it first
+            cache.pop(cache_key, None)
+            return None
+        return value
+    
+    def _cache_put(self, cache, cache_key, value, ttl):
+        """Store a value that expires ttl seconds from now"""
+        cache[cache_key] = (value, time.monotonic() + ttl)
+        return value
+    
+    def _search_key(self, location, grades, cuisines, search_term, date_range, limit):
+        """Canonical search cache key: filter lists are order-insensitive"""
+        return (
+            self._cache_version,
+            self.current_jurisdiction,
+            location,
+            tuple(sorted(grades or ())),
+            tuple(sorted(cuisines or ())),
+            search_term,
+            tuple(date_range) if date_range else None,
+            limit
+        )
+    
+    def invalidate_all(self):
+        """Invalidate every cached location list and search result, e.g. after the source data changed"""
+        self._cache_version += 1
+        self._location_cache = {}
+        self._search_cache = {}
+        try:
+            with self._disk_cache() as conn:
+                conn.execute("DELETE FROM search_cache")
+        except Exception:
+            logger.warning("Search disk cache could not be cleared", exc_info=True)
+    
+    @contextmanager
+    def _disk_cache(self):
+        """Connection to the on-disk search cache (created on first use), committed and closed on exit"""
+        os.makedirs(os.path.dirname(SEARCH_CACHE_DB), exist_ok=True)
+        with closing(sqlite3.connect(SEARCH_CACHE_DB, timeout=5)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)")
+            yield conn
+    
+    def _disk_cache_get(self, disk_key):
+        """Return a search result cached on disk by any process, or None if missing, expired or unreadable"""
+        try:
+            with self._disk_cache() as conn:
+                row = conn.execute("SELECT value, expires_at FROM search_cache WHERE key = ?", (disk_key,)).fetchone()
+                if row is None:
+                    return None
+                if time.time() >= row[1]:
+                    conn.execute("DELETE FROM search_cache WHERE key = ?", (disk_key,))
+                    return None
+                try:
+                    return pickle.loads(row[0])
+                except Exception:
+                    # Entries pickled by an older version of this code or pandas may no longer load
+                    logger.warning("Discarding unreadable search cache entry %s", disk_key, exc_info=True)
+                    conn.execute("DELETE FROM search_cache WHERE key = ?", (disk_key,))
+                    return None
+        except Exception:
+            # The disk cache is only an optimization; fall back to the API
+            logger.warning("Search disk cache read failed", exc_info=True)
+            return None
+    
+    def _disk_cache_put(self, disk_key, result_df, ttl):
+        """Store a search result on disk for ttl seconds; failures are ignored"""
+        try:
+            with self._disk_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (disk_key, pickle.dumps(result_df, protocol=pickle.HIGHEST_PROTOCOL), time.time() + ttl)
+                )
+        except Exception:
+            logger.warning("Search disk cache write failed", exc_info=True)
     
     def get_available_locations(self):
         """Get list of available locations/boroughs"""
-        cache_key = self.current_jurisdiction
-        if cache_key in self._location_cache and self._is_cache_valid():
-            return self._location_cache[cache_key]
+        cache_key = (self._cache_version, self.current_jurisdiction)
+        cached_locations = self._cache_get(self._location_cache, cache_key)
+        if cached_locations is not None:
+            return cached_locations
         
         try:
             if self.current_jurisdiction == "NYC":
@@ -378,8 +565,7 @@ class HealthInspectionAPI:
             else:
                 locations = []
             
-            self._location_cache[cache_key] = sorted(locations)
-            return self._location_cache[cache_key]
+            return self._cache_put(self._location_cache, cache_key, sorted(locations), self._cache_duration)
             
         except Exception as e:
             # Return default locations based on jurisdiction
@@ -394,15 +580,16 @@ class HealthInspectionAPI:
         Fetch restaurant inspection data with filters and pagination for larger datasets
         """
         try:
-            # Create cache key for this search
-            cache_key = f"{self.current_jurisdiction}_{location}_{grades}_{search_term}_{limit}"
+            # Check if we have cached results for this search
+            cache_key = self._search_key(location, grades, cuisines, search_term, date_range, limit)
+            cached_result = self._cache_get(self._search_cache, cache_key)
+            if cached_result is not None:
+                return cached_result
             
-            # Check if we have cached results
-            import time
-            if cache_key in self._search_cache:
-                cached_result, cached_time = self._search_cache[cache_key]
-                if time.time() - cached_time < 300:  # 5 minute cache for searches
-                    return cached_result
+            disk_key = hashlib.blake2b(repr(cache_key[1:]).encode(), digest_size=16).hexdigest()
+            cached_result = self._disk_cache_get(disk_key)
+            if cached_result is not None:
+                return self._cache_put(self._search_cache, cache_key, cached_result, self._search_cache_duration)
             
             # Call jurisdiction-specific method
             if self.current_jurisdiction == "NYC":
@@ -423,48 +610,86 @@ class HealthInspectionAPI:
             else:
                 return pd.DataFrame()
             
-            # Cache the result for faster subsequent searches
-            if all_data and len(all_data) > 0:
+            # Austin and Los Angeles build their columns directly and return a DataFrame;
+            # the fetchers that nest inspections per restaurant return row dicts
+            if isinstance(all_data, pd.DataFrame):
+                result_df = all_data.infer_objects()
+            else:
+                self._intern_violations(all_data)
                 result_df = pd.DataFrame(all_data)
+            
+            # Cache the result for faster subsequent searches
+            if not result_df.empty:
+                result_df = self._parse_inspection_dates(self._join_violations(self._to_categories(self._to_arrow_strings(result_df))))
             else:
                 result_df = pd.DataFrame()
             
-            self._search_cache[cache_key] = (result_df, time.time())
-            return result_df
+            self._disk_cache_put(disk_key, result_df, self._search_cache_duration)
+            return self._cache_put(self._search_cache, cache_key, result_df, self._search_cache_duration)
             
         except Exception as e:
             raise Exception(f"Failed to fetch restaurant data: {str(e)}")
     
+    def _intern_violations(self, restaurants):
+        """Share one string object per distinct violation text, since descriptions repeat heavily across rows"""
+        # Top-level violations are joined into one string per row, so only the
+        # per-inspection lists are kept as lists of shared strings
+        for restaurant in restaurants:
+            for inspection in restaurant.get('inspections', []):
+                inspection['violations'] = [sys.intern(v) if isinstance(v, str) else v for v in inspection.get('violations', [])]
+    
+    def _to_arrow_strings(self, df):
+        """Store scalar text columns as Arrow-backed strings for smaller frames and cheaper Streamlit serialization"""
+        for column in self._text_columns:
+            if column in df.columns:
+                df[column] = df[column].fillna('').astype('string[pyarrow]')
+        return df
+    
+    def _to_categories(self, df):
+        """Store repetitive text columns as categoricals, which keep each distinct value once"""
+        for column in self._category_columns:
+            if column in df.columns:
+                df[column] = df[column].fillna('').astype('category')
+        return df
+    
+    def _join_violations(self, df):
+        """Store each row's violations as one separator-joined Arrow string instead of a Python list"""
+        if 'violations' in df.columns:
+            df['violations'] = pd.Series(
+                [VIOLATION_SEPARATOR.join(v.replace(VIOLATION_SEPARATOR, ' ') for v in violations if isinstance(v, str))
+                 if isinstance(violations, list) else '' for violations in df['violations']],
+                index=df.index, dtype='string[pyarrow]'
+            )
+        return df
+    
+    def _parse_inspection_dates(self, df):
+        """Add an 'inspection_ts' datetime64 column parsed once from the inspection_date text; 'N/A' becomes NaT"""
+        if 'inspection_date' in df.columns:
+            df['inspection_ts'] = pd.to_datetime(df['inspection_date'], format='ISO8601', errors='coerce')
+        return df
+    
     def _get_nyc_restaurants(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
         """Fetch NYC restaurant inspection data"""
         # Build where clause conditions
         where_conditions = ['grade IS NOT NULL']
         
         if location and location != "All":
-            where_conditions.append(f"boro='{location}'")
+            where_conditions.append(f"boro={soql_quote(location)}")
         
         if grades:
-            grade_conditions = [f"grade='{grade}'" for grade in grades]
+            grade_conditions = [f"grade={soql_quote(grade)}" for grade in grades]
             where_conditions.append(f"({' OR '.join(grade_conditions)})")
         
         if search_term:
             # Handle advanced search modes
-            if search_term.startswith('"') and search_term.endswith('"'):
-                # Exact word matching
-                exact_term = search_term.strip('"')
-                where_conditions.append(f"UPPER(dba) = '{exact_term.upper()}'")
-            elif search_term.endswith('*'):
-                # Starts with matching
-                prefix_term = search_term.rstrip('*')
-                where_conditions.append(f"UPPER(dba) LIKE '{prefix_term.upper()}%'")
-            else:
-                # Contains matching (default)
-                where_conditions.append(f"UPPER(dba) LIKE '%{search_term.upper()}%'")
+            where_conditions.append(name_match_condition('dba', search_term))
+        
+        if cuisines and "All" not in cuisines:
+            # Let the API drop other cuisines instead of downloading and discarding them
+            where_conditions.append(in_condition('cuisine_description', cuisines))
         
         if date_range and len(date_range) == 2:
-            start_date = date_range[0].strftime('%Y-%m-%d')
-            end_date = date_range[1].strftime('%Y-%m-%d')
-            where_conditions.append(f"inspection_date >= '{start_date}' AND inspection_date <= '{end_date}'")
+            where_conditions.append(date_range_condition('inspection_date', date_range))
         
         where_clause = ' AND '.join(where_conditions)
         
@@ -473,7 +698,7 @@ class HealthInspectionAPI:
             '$limit': min(limit * 120, self._max_records_per_request),
             '$order': 'inspection_date DESC',
             '$where': where_clause,
-            '$select': 'camis,dba,boro,building,street,zipcode,phone,cuisine_description,inspection_date,action,violation_code,violation_description,critical_flag,score,grade,grade_date,record_date,inspection_type'
+            '$select': 'camis,dba,boro,building,street,zipcode,phone,cuisine_description,inspection_date,violation_code,violation_description,critical_flag,score,grade,inspection_type'
         }
         
         raw_data = self._make_api_request(self.current_api["base_url"], params)
@@ -482,60 +707,44 @@ class HealthInspectionAPI:
             return []
         
         # Process NYC data with multiple inspections per restaurant
-        restaurants_dict = {}
-        
-        for item in raw_data:
-            # Create unique identifier for restaurant
-            restaurant_key = (item.get('dba', '').strip(), item.get('building', ''), item.get('street', ''))
-            
-            # Create inspection record
-            inspection = {
-                'grade': item.get('grade', 'Not Yet Graded'),
-                'score': self._safe_int(item.get('score')),
-                'inspection_date': item.get('inspection_date', '').split('T')[0] if item.get('inspection_date') else 'N/A',
-                'violations': self._extract_violations(item),
-                'inspection_type': item.get('inspection_type', ''),
-                'critical_flag': item.get('critical_flag', '')
-            }
-            
-            if restaurant_key not in restaurants_dict:
-                # Create new restaurant entry
-                restaurants_dict[restaurant_key] = {
-                    'id': f"{item.get('camis', '')}{item.get('dba', '').replace(' ', '')}",
-                    'name': item.get('dba', 'Unknown Restaurant').strip(),
-                    'address': self._format_address(item),
-                    'cuisine_type': item.get('cuisine_description', 'Not specified'),
-                    'boro': item.get('boro', ''),
-                    'phone': item.get('phone', ''),
-                    'inspections': [inspection]
-                }
-            else:
-                # Add inspection to existing restaurant
-                restaurants_dict[restaurant_key]['inspections'].append(inspection)
-        
-        # Convert to list and add latest inspection info to main level
-        restaurants = []
-        for restaurant_data in restaurants_dict.values():
-            # Sort inspections by date (most recent first)
-            restaurant_data['inspections'].sort(key=lambda x: x['inspection_date'], reverse=True)
-            
-            # Add latest inspection data to main restaurant level for compatibility
-            latest_inspection = restaurant_data['inspections'][0] if restaurant_data['inspections'] else {}
-            restaurant_data.update({
-                'grade': latest_inspection.get('grade', 'Not Yet Graded'),
-                'score': latest_inspection.get('score'),
-                'inspection_date': latest_inspection.get('inspection_date', 'N/A'),
-                'violations': latest_inspection.get('violations', []),
-                'inspection_type': latest_inspection.get('inspection_type', '')
-            })
-            
-            restaurants.append(restaurant_data)
+        # Number restaurants in order of first appearance and keep only the rows of the
+        # first `limit`, so inspection fields are derived just for returned restaurants
+        raw = pd.DataFrame(raw_data).reindex(columns=[
+            'camis', 'dba', 'building', 'street', 'boro', 'zipcode', 'phone', 'cuisine_description',
+            'inspection_date', 'grade', 'score', 'inspection_type', 'critical_flag',
+            'violation_description', 'violation_code'
+        ])
+        restaurant_codes = raw.groupby(
+            [raw['dba'].fillna('').str.strip(), raw['building'].fillna(''), raw['street'].fillna('')], sort=False
+        ).ngroup()
+        raw = raw[restaurant_codes < limit]
+        restaurant_codes = restaurant_codes[raw.index]
+        
+        inspection_dates = self._format_inspection_dates(raw['inspection_date'])
+        scores = pd.to_numeric(raw['score'], errors='coerce')
+        critical_flags = raw['critical_flag'].fillna('')
+        
+        inspections = pd.DataFrame({
+            'grade': raw['grade'].fillna('Not Yet Graded'),
+            'score': pd.Series([int(score) if score == score else None for score in scores], index=raw.index, dtype=object),
+            'inspection_date': inspection_dates,
+            'violations': list(map(_nyc_violations, raw['violation_description'].fillna(''), critical_flags, raw['violation_code'].fillna(''))),
+            'inspection_type': raw['inspection_type'].fillna(''),
+            'critical_flag': critical_flags
+        })
         
-        # Apply cuisine filter if specified
-        if cuisines and "All" not in cuisines:
-            restaurants = [r for r in restaurants if r['cuisine_type'] in cuisines]
+        # Restaurant-level fields come from each restaurant's first row
+        first_rows = raw[~restaurant_codes.duplicated()]
+        details = pd.DataFrame({
+            'id': first_rows['camis'].fillna('') + first_rows['dba'].fillna('').str.replace(' ', ''),
+            'name': first_rows['dba'].fillna('Unknown Restaurant').str.strip(),
+            'address': self._format_addresses(first_rows, ('building', 'street', 'boro', 'zipcode')),
+            'cuisine_type': first_rows['cuisine_description'].fillna('Not specified'),
+            'boro': first_rows['boro'].fillna(''),
+            'phone': first_rows['phone'].fillna('')
+        })
         
-        return restaurants[:limit]
+        return self._group_inspections(details, inspections, restaurant_codes)
     
     def _get_chicago_restaurants(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
         """Fetch Chicago restaurant inspection data"""
@@ -548,40 +757,22 @@ class HealthInspectionAPI:
         #     where_conditions.append(f"ward='{ward_num}'")
         
         if grades:
-            # Map NYC grades to Chicago results
-            chicago_results = []
-            for grade in grades:
-                if grade == "A":
-                    chicago_results.extend(["Pass", "Pass w/ Conditions"])
-                elif grade == "B":
-                    chicago_results.append("Pass w/ Conditions")
-                elif grade == "C":
-                    chicago_results.extend(["Fail", "Out of Business"])
-                elif grade in ["Grade Pending", "Not Yet Graded"]:
-                    chicago_results.append("Not Ready")
+            # Map NYC grades to Chicago results and pass native results through; sorted
+            # and deduplicated so the same selection always sends the same $where
+            chicago_results = sorted({result for grade in grades for result in CHICAGO_RESULTS_BY_GRADE.get(grade, (grade,))})
             
             if chicago_results:
-                result_conditions = [f"results='{result}'" for result in chicago_results]
-                where_conditions.append(f"({' OR '.join(result_conditions)})")
+                where_conditions.append(in_condition('results', chicago_results))
         
         if search_term:
             # Handle advanced search modes
-            if search_term.startswith('"') and search_term.endswith('"'):
-                # Exact word matching
-                exact_term = search_term.strip('"')
-                where_conditions.append(f"UPPER(dba_name) = '{exact_term.upper()}'")
-            elif search_term.endswith('*'):
-                # Starts with matching
-                prefix_term = search_term.rstrip('*')
-                where_conditions.append(f"UPPER(dba_name) LIKE '{prefix_term.upper()}%'")
-            else:
-                # Contains matching (default)
-                where_conditions.append(f"UPPER(dba_name) LIKE '%{search_term.upper()}%'")
+            where_conditions.append(name_match_condition('dba_name', search_term))
+        
+        if cuisines and "All" not in cuisines:
+            where_conditions.append(in_condition('facility_type', cuisines))
         
         if date_range and len(date_range) == 2:
-            start_date = date_range[0].strftime('%Y-%m-%d')
-            end_date = date_range[1].strftime('%Y-%m-%d')
-            where_conditions.append(f"inspection_date >= '{start_date}' AND inspection_date <= '{end_date}'")
+            where_conditions.append(date_range_condition('inspection_date', date_range))
         
         where_clause = ' AND '.join(where_conditions)
         
@@ -590,7 +781,7 @@ class HealthInspectionAPI:
             '$limit': min(limit * 120, self._max_records_per_request),
             '$order': 'inspection_date DESC',
             '$where': where_clause,
-            '$select': 'license_,dba_name,aka_name,facility_type,risk,address,city,state,zip,inspection_date,inspection_type,results,latitude,longitude'
+            '$select': 'license_,dba_name,facility_type,risk,address,city,state,zip,inspection_date,inspection_type,results,violations'
         }
         
         raw_data = self._make_api_request(self.current_api["base_url"], params)
@@ -598,64 +789,42 @@ class HealthInspectionAPI:
         if not raw_data:
             return []
         
-        # Process Chicago data with multiple inspections per restaurant
-        restaurants_dict = {}
-        
-        for item in raw_data:
-            # Create unique identifier for restaurant
-            restaurant_key = (item.get('dba_name', '').strip(), item.get('address', ''))
-            
-            # Use native Chicago grading system
-            chicago_result = item.get('results', 'Not Ready')
-            
-            # Create inspection record
-            inspection = {
-                'grade': chicago_result,
-                'score': None,  # Chicago doesn't use numeric scores
-                'inspection_date': item.get('inspection_date', '').split('T')[0] if item.get('inspection_date') else 'N/A',
-                'violations': self._extract_chicago_violations(item),
-                'inspection_type': item.get('inspection_type', ''),
-                'risk_level': item.get('risk', '')
-            }
-            
-            if restaurant_key not in restaurants_dict:
-                # Create new restaurant entry
-                restaurants_dict[restaurant_key] = {
-                    'id': f"CHI_{item.get('license_', '')}{item.get('dba_name', '').replace(' ', '')}",
-                    'name': item.get('dba_name', 'Unknown Restaurant').strip(),
-                    'address': self._format_chicago_address(item),
-                    'cuisine_type': item.get('facility_type', 'Not specified'),
-                    'boro': f"Chicago, IL {item.get('zip', '')}",
-                    'phone': '',
-                    'inspections': [inspection]
-                }
-            else:
-                # Add inspection to existing restaurant
-                restaurants_dict[restaurant_key]['inspections'].append(inspection)
-        
-        # Convert to list and add latest inspection info to main level
-        restaurants = []
-        for restaurant_data in restaurants_dict.values():
-            # Sort inspections by date (most recent first)
-            restaurant_data['inspections'].sort(key=lambda x: x['inspection_date'], reverse=True)
-            
-            # Add latest inspection data to main restaurant level for compatibility
-            latest_inspection = restaurant_data['inspections'][0] if restaurant_data['inspections'] else {}
-            restaurant_data.update({
-                'grade': latest_inspection.get('grade', 'Not Ready'),
-                'score': latest_inspection.get('score'),
-                'inspection_date': latest_inspection.get('inspection_date', 'N/A'),
-                'violations': latest_inspection.get('violations', []),
-                'inspection_type': latest_inspection.get('inspection_type', '')
-            })
-            
-            restaurants.append(restaurant_data)
+        # Number restaurants in order of first appearance and keep only the rows of the
+        # first `limit`, so inspection fields are derived just for returned restaurants
+        raw = pd.DataFrame(raw_data).reindex(columns=[
+            'license_', 'dba_name', 'address', 'city', 'state', 'zip', 'facility_type',
+            'inspection_date', 'results', 'inspection_type', 'risk', 'violations'
+        ])
+        restaurant_codes = raw.groupby(
+            [raw['dba_name'].fillna('').str.strip(), raw['address'].fillna('')], sort=False
+        ).ngroup()
+        raw = raw[restaurant_codes < limit]
+        restaurant_codes = restaurant_codes[raw.index]
+        
+        inspection_dates = self._format_inspection_dates(raw['inspection_date'])
+        
+        # Use native Chicago grading system; Chicago doesn't use numeric scores
+        inspections = pd.DataFrame({
+            'grade': raw['results'].fillna('Not Ready'),
+            'score': None,
+            'inspection_date': inspection_dates,
+            'violations': list(map(_chicago_violations, raw['violations'].fillna(''))),
+            'inspection_type': raw['inspection_type'].fillna(''),
+            'risk_level': raw['risk'].fillna('')
+        })
         
-        # Apply cuisine filter if specified
-        if cuisines and "All" not in cuisines:
-            restaurants = [r for r in restaurants if r['cuisine_type'] in cuisines]
+        # Restaurant-level fields come from each restaurant's first row
+        first_rows = raw[~restaurant_codes.duplicated()]
+        details = pd.DataFrame({
+            'id': 'CHI_' + first_rows['license_'].fillna('') + first_rows['dba_name'].fillna('').str.replace(' ', ''),
+            'name': first_rows['dba_name'].fillna('Unknown Restaurant').str.strip(),
+            'address': self._format_addresses(first_rows, ('address', 'city', 'state', 'zip')),
+            'cuisine_type': first_rows['facility_type'].fillna('Not specified'),
+            'boro': 'Chicago, IL ' + first_rows['zip'].fillna(''),
+            'phone': ''
+        })
         
-        return restaurants[:limit]
+        return self._group_inspections(details, inspections, restaurant_codes)
     
     def _get_austin_restaurants(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
         """Fetch Austin restaurant inspection data"""
@@ -663,22 +832,10 @@ class HealthInspectionAPI:
         
         if search_term:
             # Handle advanced search modes
-            if search_term.startswith('"') and search_term.endswith('"'):
-                # Exact word matching
-                exact_term = search_term.strip('"')
-                where_conditions.append(f"UPPER(restaurant_name) = '{exact_term.upper()}'")
-            elif search_term.endswith('*'):
-                # Starts with matching
-                prefix_term = search_term.rstrip('*')
-                where_conditions.append(f"UPPER(restaurant_name) LIKE '{prefix_term.upper()}%'")
-            else:
-                # Contains matching (default)
-                where_conditions.append(f"UPPER(restaurant_name) LIKE '%{search_term.upper()}%'")
+            where_conditions.append(name_match_condition('restaurant_name', search_term))
         
         if date_range and len(date_range) == 2:
-            start_date = date_range[0].strftime('%Y-%m-%d')
-            end_date = date_range[1].strftime('%Y-%m-%d')
-            where_conditions.append(f"inspection_date >= '{start_date}' AND inspection_date <= '{end_date}'")
+            where_conditions.append(date_range_condition('inspection_date', date_range))
         
         where_clause = ' AND '.join(where_conditions)
         
@@ -694,47 +851,44 @@ class HealthInspectionAPI:
         if not raw_data:
             return []
         
-        restaurants = []
-        seen_restaurants = set()
-        
-        for item in raw_data:
-            restaurant_key = (item.get('restaurant_name', '').strip(), item.get('address_1', ''))
-            
-            if restaurant_key in seen_restaurants:
-                continue
-            seen_restaurants.add(restaurant_key)
-            
-            # Convert score to Austin grade
-            score = self._safe_int(item.get('score'))
-            if score and score >= 90:
-                grade = "90-100"
-            elif score and score >= 80:
-                grade = "80-89"
-            elif score and score >= 70:
-                grade = "70-79"
-            else:
-                grade = "Below 70"
-            
-            restaurant = {
-                'id': f"AUS_{item.get('facility_id', '')}{item.get('restaurant_name', '').replace(' ', '')}",
-                'name': item.get('restaurant_name', 'Unknown Restaurant').strip(),
-                'address': f"{item.get('address', '')}, Austin, TX {item.get('zip_code', '')}",
-                'cuisine_type': item.get('process_description', 'Not specified'),
-                'grade': grade,
-                'score': score,
-                'inspection_date': item.get('inspection_date', '').split('T')[0] if item.get('inspection_date') else 'N/A',
-                'violations': ["Violation details not available in Austin dataset"],
-                'boro': f"Austin, TX {item.get('zip_code', '')}",
-                'phone': '',
-                'inspection_type': 'Regular Inspection'
-            }
-            
-            restaurants.append(restaurant)
+        # Deduplicate and derive every column with pandas instead of a per-row loop;
+        # rows arrive newest-first, so keeping the first row keeps the latest inspection
+        raw = pd.DataFrame(raw_data).reindex(columns=[
+            'restaurant_name', 'address_1', 'address', 'zip_code', 'score',
+            'inspection_date', 'process_description', 'facility_id'
+        ])
+        raw_names = raw['restaurant_name'].fillna('')
+        raw = raw.assign(name=raw_names.str.strip(), address_1=raw['address_1'].fillna(''))
+        raw = raw.drop_duplicates(subset=['name', 'address_1'])
         
         if cuisines and "All" not in cuisines:
-            restaurants = [r for r in restaurants if r['cuisine_type'] in cuisines]
+            raw = raw[raw['process_description'].fillna('Not specified').isin(cuisines)]
+        raw = raw.head(limit)
+        
+        # Convert score to Austin grade
+        scores = pd.to_numeric(raw['score'], errors='coerce')
+        grades = (pd.Series("Below 70", index=raw.index)
+                  .mask(scores >= 70, "70-79")
+                  .mask(scores >= 80, "80-89")
+                  .mask(scores >= 90, "90-100"))
+        zip_codes = raw['zip_code'].fillna('')
+        inspection_dates = self._format_inspection_dates(raw['inspection_date'])
+        
+        restaurants = pd.DataFrame({
+            'id': 'AUS_' + raw['facility_id'].fillna('') + raw_names.loc[raw.index].str.replace(' ', ''),
+            'name': raw['name'],
+            'address': raw['address'].fillna('') + ', Austin, TX ' + zip_codes,
+            'cuisine_type': raw['process_description'].fillna('Not specified'),
+            'grade': grades,
+            'score': pd.Series([int(score) if score == score else None for score in scores], index=raw.index, dtype=object),
+            'inspection_date': inspection_dates,
+            'violations': [["Violation details not available in Austin dataset"] for _ in range(len(raw))],
+            'boro': 'Austin, TX ' + zip_codes,
+            'phone': '',
+            'inspection_type': 'Regular Inspection'
+        }).reset_index(drop=True)
         
-        return restaurants[:limit]
+        return restaurants
     
     def _get_seattle_restaurants(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
         """Fetch Seattle restaurant inspection data using enhanced extraction"""
@@ -746,23 +900,31 @@ class HealthInspectionAPI:
         batch_size = 50000  # Maximum recommended by Socrata
         max_records = min(400000, limit * 100)  # Process enough records to extract 4,000+ unique restaurants
         
-        for offset in range(0, min(max_records, 500000), batch_size):
+        # Add search filters
+        where_conditions = []
+        if search_term:
+            where_conditions.append(f"UPPER(name) LIKE {soql_quote('%' + search_term.upper() + '%')}")
+        where_clause = ' AND '.join(where_conditions) or None
+        
+        def fetch_page(offset):
             params = {
                 '$limit': batch_size,
                 '$offset': offset,
                 '$select': 'name,address,business_id,program_identifier,violation_points,inspection_score,inspection_date,inspection_type,zip_code',
                 '$order': 'business_id'
             }
-            
-            # Add search filters
-            where_conditions = []
-            if search_term:
-                where_conditions.append(f"UPPER(name) LIKE '%{search_term.upper()}%'")
-            
-            if where_conditions:
-                params['$where'] = ' AND '.join(where_conditions)
-            
-            raw_data = self._make_api_request(self.current_api["base_url"], params)
+            if where_clause:
+                params['$where'] = where_clause
+            return _PAGE_EXECUTOR.submit(self._make_api_request, self.current_api["base_url"], params)
+        
+        # Keep at most two pages outstanding: the next page downloads while this one is
+        # processed, and nothing more is requested once enough restaurants are found.
+        # Pages are processed in offset order, so the result matches a sequential scan
+        offsets = iter(range(0, min(max_records, 500000), batch_size))
+        page_futures = deque(fetch_page(offset) for offset in islice(offsets, 2))
+        
+        while page_futures:
+            raw_data = page_futures.popleft().result()
             
             if not raw_data or len(raw_data) == 0:
                 break  # No more data
@@ -818,6 +980,14 @@ class HealthInspectionAPI:
             # Continue processing more batches to reach target coverage
             if len(all_restaurants) >= 4000:
                 break
+            
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                page_futures.append(fetch_page(next_offset))
+        
+        # A prefetched page that is still queued is no longer needed
+        for page_future in page_futures:
+            page_future.cancel()
         
         # Apply filters and return results
         if cuisines and "All" not in cuisines:
@@ -964,72 +1134,6 @@ class HealthInspectionAPI:
         
         return restaurants
         
-    def _get_boston_restaurants_old(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
-        """Original Boston restaurant fetch method - keeping as backup"""
-        try:
-            params = {
-                'resource_id': self.current_api["resource_id"],
-                'limit': min(limit * 15, 5000)
-            }
-            
-            if search_term:
-                params['q'] = search_term
-            
-            raw_data = self._make_api_request(self.current_api["base_url"], params)
-            
-            if not raw_data or 'result' not in raw_data or 'records' not in raw_data['result']:
-                return []
-            
-            records = raw_data['result']['records']
-            restaurants = []
-            seen_restaurants = set()
-            
-            for item in records:
-                business_name = item.get('businessname', '').strip()
-                if not business_name:
-                    continue
-                    
-                restaurant_key = (business_name, item.get('address', ''))
-                
-                if restaurant_key in seen_restaurants:
-                    continue
-                seen_restaurants.add(restaurant_key)
-                
-                # Use Boston's pass/fail result system
-                result = item.get('result', 'Unknown')
-                grade = result if result in ['HE_Pass', 'HE_Fail', 'Conditional'] else 'Unknown'
-                
-                # Get violation information
-                violation_desc = item.get('violdesc', 'No violations recorded')
-                viol_level = item.get('viol_level', '')
-                
-                restaurant = {
-                    'id': f"BOS_{item.get('licenseno', '')}{business_name.replace(' ', '')}",
-                    'name': business_name,
-                    'address': self._format_boston_address(item),
-                    'cuisine_type': item.get('descript', 'Not specified'),
-                    'grade': grade,
-                    'score': None,
-                    'inspection_date': item.get('resultdttm', '').split('T')[0] if item.get('resultdttm') else 'N/A',
-                    'violations': [f"({viol_level}) {violation_desc}" if viol_level else violation_desc],
-                    'boro': f"Boston, MA {item.get('zip', '')}",
-                    'phone': '',
-                    'inspection_type': 'Health Inspection',
-                    'violation_level': viol_level
-                }
-                
-                restaurants.append(restaurant)
-            
-            # Apply cuisine filter if provided
-            if cuisines and "All" not in cuisines:
-                restaurants = [r for r in restaurants if r['cuisine_type'] in cuisines]
-            
-            return restaurants[:limit]
-            
-        except Exception as e:
-            print(f"Boston API error: {e}")
-            return []
-    
     def _get_losangeles_restaurants(self, location=None, grades=None, cuisines=None, search_term=None, date_range=None, limit=500):
         """Fetch Los Angeles City restaurant inspection data"""
         params = {'$limit': min(limit * 120, self._max_records_per_request)}
@@ -1038,17 +1142,7 @@ class HealthInspectionAPI:
         where_conditions = []
         if search_term:
             # Handle advanced search modes
-            if search_term.startswith('"') and search_term.endswith('"'):
-                # Exact word matching
-                exact_term = search_term.strip('"')
-                where_conditions.append(f"UPPER(facility_name) = '{exact_term.upper()}'")
-            elif search_term.endswith('*'):
-                # Starts with matching
-                prefix_term = search_term.rstrip('*')
-                where_conditions.append(f"UPPER(facility_name) LIKE '{prefix_term.upper()}%'")
-            else:
-                # Contains matching (default)
-                where_conditions.append(f"UPPER(facility_name) LIKE '%{search_term.upper()}%'")
+            where_conditions.append(name_match_condition('facility_name', search_term))
         
         if where_conditions:
             params['$where'] = ' AND '.join(where_conditions)
@@ -1058,75 +1152,39 @@ class HealthInspectionAPI:
         if not raw_data:
             return []
         
-        restaurants = []
-        seen_restaurants = set()
-        
-        for item in raw_data:
-            facility_name = item.get('facility_name', '').strip()
-            if not facility_name:
-                continue
-                
-            restaurant_key = (facility_name, item.get('facility_address', ''))
-            
-            if restaurant_key in seen_restaurants:
-                continue
-            seen_restaurants.add(restaurant_key)
-            
-            restaurant = {
-                'id': f"LA_{item.get('serial_number', '')}{facility_name.replace(' ', '')}",
-                'name': facility_name,
-                'address': self._format_losangeles_address(item),
-                'cuisine_type': item.get('pe_description', 'Not specified'),
-                'grade': item.get('grade', 'Not Graded'),
-                'score': self._safe_int(item.get('score')),
-                'inspection_date': item.get('activity_date', '').split('T')[0] if item.get('activity_date') else 'N/A',
-                'violations': [item.get('violation_description', 'No violations recorded')],
-                'boro': f"Los Angeles, CA {item.get('zip_code', '')}",
-                'phone': '',
-                'inspection_type': item.get('inspection_type', 'Health Inspection')
-            }
-            
-            restaurants.append(restaurant)
+        # Deduplicate with pandas' hashed drop_duplicates instead of a set of tuple keys;
+        # the first row seen for a facility is the one kept
+        raw = pd.DataFrame(raw_data).reindex(columns=[
+            'facility_name', 'facility_address', 'city', 'zip_code', 'serial_number', 'pe_description',
+            'grade', 'score', 'activity_date', 'violation_description', 'inspection_type'
+        ])
+        raw = raw.assign(name=raw['facility_name'].fillna('').str.strip(), facility_address=raw['facility_address'].fillna(''))
+        raw = raw[raw['name'] != ''].drop_duplicates(subset=['name', 'facility_address'])
         
         if cuisines and "All" not in cuisines:
-            restaurants = [r for r in restaurants if r['cuisine_type'] in cuisines]
-        
-        return restaurants[:limit]
-    
-    def _format_chicago_address(self, item):
-        """Format Chicago restaurant address from API data"""
-        address = item.get('address', '')
-        city = item.get('city', '')
-        state = item.get('state', '')
-        zip_code = item.get('zip', '')
-        
-        address_parts = [part for part in [address, city, state, zip_code] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
-    
-    def _extract_chicago_violations(self, item):
-        """Extract violation information from Chicago API response"""
-        violations = []
-        violation_text = item.get('violations', '')
+            raw = raw[raw['pe_description'].fillna('Not specified').isin(cuisines)]
+        raw = raw.head(limit)
+        if raw.empty:
+            return []
         
-        if violation_text and violation_text.strip():
-            # Chicago violations are in a single text field, split by common delimiters
-            violation_parts = violation_text.replace('|', '\n').split('\n')
-            for part in violation_parts:
-                if part.strip():
-                    violations.append(part.strip())
+        scores = pd.to_numeric(raw['score'], errors='coerce')
+        inspection_dates = self._format_inspection_dates(raw['activity_date'])
+        
+        restaurants = pd.DataFrame({
+            'id': 'LA_' + raw['serial_number'].fillna('') + raw['name'].str.replace(' ', ''),
+            'name': raw['name'],
+            'address': self._format_addresses(raw.assign(city=raw['city'].fillna('Los Angeles')), ('facility_address', 'city', 'zip_code')),
+            'cuisine_type': raw['pe_description'].fillna('Not specified'),
+            'grade': raw['grade'].fillna('Not Graded'),
+            'score': pd.Series([int(score) if score == score else None for score in scores], index=raw.index, dtype=object),
+            'inspection_date': inspection_dates,
+            'violations': [[violation] for violation in raw['violation_description'].fillna('No violations recorded')],
+            'boro': 'Los Angeles, CA ' + raw['zip_code'].fillna(''),
+            'phone': '',
+            'inspection_type': raw['inspection_type'].fillna('Health Inspection')
+        }).reset_index(drop=True)
         
-        return violations if violations else ["No violations recorded"]
-    
-    def _format_austin_address(self, item):
-        """Format Austin restaurant address from API data"""
-        address_1 = item.get('address_1', '')
-        address_2 = item.get('address_2', '')
-        city = item.get('city', '')
-        state = item.get('state', '')
-        zip_code = item.get('zip_code', '')
-        
-        address_parts = [part for part in [address_1, address_2, city, state, zip_code] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
+        return restaurants
     
     def _format_seattle_address(self, item):
         """Format Seattle restaurant address from API data"""
@@ -1137,6 +1195,53 @@ class HealthInspectionAPI:
         address_parts = [part for part in [address, city, zip_code] if part]
         return ', '.join(address_parts) if address_parts else 'Address not available'
     
+    def _group_inspections(self, details, inspections, restaurant_codes):
+        """Attach each restaurant's inspections (rows mapped by restaurant_codes) newest first, promoting the latest"""
+        # A stable sort keeps same-day inspections in arrival order, as list.sort did
+        ordered = inspections.assign(restaurant_code=restaurant_codes).sort_values(
+            ['restaurant_code', 'inspection_date'], ascending=[True, False], kind='stable'
+        )
+        inspection_counts = ordered.pop('restaurant_code').value_counts(sort=False).sort_index()
+        inspection_records = self._frame_records(ordered)
+        
+        restaurants = self._frame_records(details)
+        start = 0
+        for restaurant, count in zip(restaurants, inspection_counts):
+            restaurant_inspections = inspection_records[start:start + count]
+            start += count
+            latest_inspection = restaurant_inspections[0]
+            restaurant['inspections'] = restaurant_inspections
+            restaurant.update({
+                'grade': latest_inspection['grade'],
+                'score': latest_inspection['score'],
+                'inspection_date': latest_inspection['inspection_date'],
+                'violations': latest_inspection['violations'],
+                'inspection_type': latest_inspection['inspection_type']
+            })
+        return restaurants
+    
+    def _frame_records(self, frame):
+        """Same as frame.to_dict('records'), but zips whole columns instead of boxing cell by cell"""
+        columns = list(frame.columns)
+        return [dict(zip(columns, values)) for values in zip(*(frame[column].tolist() for column in columns))]
+    
+    def _format_inspection_dates(self, values):
+        """Reduce ISO timestamps to 'YYYY-MM-DD' ('N/A' if missing or unparseable), parsing each distinct value once"""
+        codes, uniques = pd.factorize(values)
+        days = pd.to_datetime(pd.Series(uniques, dtype=object), format='ISO8601', errors='coerce').dt.strftime('%Y-%m-%d').fillna('N/A')
+        # Missing values are coded -1, which takes the trailing 'N/A'
+        return pd.Series(days.tolist() + ['N/A']).take(codes).set_axis(values.index)
+    
+    def _format_addresses(self, raw_data, fields):
+        """Join the non-empty address fields of every raw row with ', ' in column operations"""
+        parts = pd.DataFrame(raw_data).reindex(columns=list(fields)).fillna('').astype(str)
+        addresses = parts[fields[0]]
+        for field in fields[1:]:
+            part = parts[field]
+            separator = ((addresses != '') & (part != '')).map({True: ', ', False: ''})
+            addresses = addresses + separator + part
+        return addresses.where(addresses != '', 'Address not available').tolist()
+    
     def _format_boston_address(self, item):
         """Format Boston restaurant address from API data"""
         address = item.get('address', '')
@@ -1147,51 +1252,21 @@ class HealthInspectionAPI:
         address_parts = [part for part in [address, city, state, zip_code] if part]
         return ', '.join(address_parts) if address_parts else 'Address not available'
     
-    def _format_losangeles_address(self, item):
-        """Format Los Angeles restaurant address from API data"""
-        address = item.get('facility_address', '')
-        city = item.get('city', 'Los Angeles')
-        zip_code = item.get('zip_code', '')
-        
-        address_parts = [part for part in [address, city, zip_code] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
-    
-    def _format_address(self, item):
-        """Format restaurant address from API data"""
-        building = item.get('building', '')
-        street = item.get('street', '')
-        boro = item.get('boro', '')
-        zipcode = item.get('zipcode', '')
-        
-        address_parts = [part for part in [building, street, boro, zipcode] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
-    
-    def _safe_int(self, value):
+    # Both helpers are pure and see the same few values over and over
+    # (scores, points, timestamps), so repeated inputs are answered from a cache;
+    # lists or dicts from a malformed payload just bypass it
+    @staticmethod
+    @_memoize_hashable
+    def _safe_int(value):
         """Safely convert value to integer"""
         try:
             return int(float(value)) if value and str(value).strip() else None
         except (ValueError, TypeError):
             return None
     
-    def _extract_violations(self, item):
-        """Extract violation information from API response"""
-        violations = []
-        
-        # Check for violation description
-        if item.get('violation_description'):
-            violations.append(item['violation_description'])
-        
-        # Check for critical flag
-        if item.get('critical_flag') == 'Y':
-            violations.append("Critical violation found")
-        
-        # Add violation code if available
-        if item.get('violation_code'):
-            violations.append(f"Violation code: {item['violation_code']}")
-        
-        return violations if violations else ["No violations recorded"]
-    
-    def _safe_date_extract(self, date_str):
+    @staticmethod
+    @_memoize_hashable
+    def _safe_date_extract(date_str):
         """Safely extract date from datetime string"""
         try:
             if not date_str or not isinstance(date_str, str):
@@ -1224,18 +1299,18 @@ class HealthInspectionAPI:
             
             if search_term.startswith('"') and search_term.endswith('"'):
                 exact_term = search_term.strip('"')
-                where_conditions.append(f"UPPER(Name) = '{exact_term.upper()}'")
+                where_conditions.append(f"UPPER(Name) = {soql_quote(exact_term.upper())}")
             elif search_term.endswith('*'):
                 prefix_term = search_term.rstrip('*')
-                where_conditions.append(f"UPPER(Name) LIKE '{prefix_term.upper()}%'")
+                where_conditions.append(f"UPPER(Name) LIKE {soql_quote(prefix_term.upper() + '%')}")
             else:
-                where_conditions.append(f"UPPER(Name) LIKE '%{search_normalized.upper()}%'")
+                where_conditions.append(f"UPPER(Name) LIKE {soql_quote('%' + search_normalized.upper() + '%')}")
         
         if location and location != "All":
             # Extract ZIP code from location if present
             if "(" in location and ")" in location:
                 zip_code = location.split("(")[1].split(")")[0]
-                where_conditions.append(f"ZIP_CODE = '{zip_code}'")
+                where_conditions.append(f"ZIP_CODE = {soql_quote(zip_code)}")
         
         # Filter by compliance status if specified (Detroit uses In_Compliance field)
         if grades and "All" not in grades:
@@ -1320,78 +1395,6 @@ class HealthInspectionAPI:
             print(f"Detroit API error: {e}")
             return []
     
-    def _format_dallas_address(self, item):
-        """Format Dallas restaurant address from API data"""
-        address = item.get('address', '')
-        city = item.get('city', 'Dallas')
-        state = item.get('state', 'TX')
-        zip_code = item.get('zip_code', '')
-        
-        address_parts = [part for part in [address, city, state, zip_code] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
-    
-    def _format_virginia_address(self, item):
-        """Format Virginia restaurant address from API data"""
-        address = item.get('address', '')
-        city = item.get('city', '')
-        locality = item.get('locality', 'Norfolk')
-        state = 'VA'
-        
-        address_parts = [part for part in [address, city or locality, state] if part]
-        return ', '.join(address_parts) if address_parts else 'Address not available'
-    
-    def _extract_dallas_violations(self, item):
-        """Extract violation information from Dallas API response"""
-        violations = []
-        
-        # Check for violation description
-        violation_desc = item.get('violation_description', '')
-        if violation_desc and violation_desc.strip():
-            violations.append(violation_desc.strip())
-        
-        # Check for temperature violations
-        if item.get('temperature_violation') == 'Y':
-            violations.append("Temperature violation found")
-        
-        # Check for critical violations
-        if item.get('critical_violation') == 'Y':
-            violations.append("Critical violation found")
-        
-        return violations if violations else ["No violations recorded"]
-    
-    def _extract_virginia_violations(self, item):
-        """Extract violation information from Virginia API response"""
-        violations = []
-        
-        # Check for violation description
-        violation_desc = item.get('violation_description', '')
-        if violation_desc and violation_desc.strip():
-            violations.append(violation_desc.strip())
-        
-        # Check for inspection notes
-        notes = item.get('inspection_notes', '')
-        if notes and notes.strip():
-            violations.append(f"Notes: {notes.strip()}")
-        
-        return violations if violations else ["No violations recorded"]
-    
-    def _format_detroit_address(self, attrs):
-        """Format Detroit address from ArcGIS API response"""
-        address_parts = []
-        if attrs.get('ADDRESS'):
-            address_parts.append(attrs['ADDRESS'])
-        if attrs.get('CITY'):
-            address_parts.append(attrs['CITY'])
-        else:
-            address_parts.append('Detroit')
-        if attrs.get('STATE'):
-            address_parts.append(attrs['STATE'])
-        else:
-            address_parts.append('MI')
-        if attrs.get('ZIP_CODE'):
-            address_parts.append(str(attrs['ZIP_CODE']))
-        return ', '.join(filter(None, address_parts))
-    
     def _extract_detroit_violations(self, attrs):
         """Extract violations from Detroit ArcGIS data"""
         violations = []
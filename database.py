@@ -1,11 +1,14 @@
 import os
+import logging
 import psycopg2
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey
+from sqlalchemy import create_engine, func, Column, Integer, String, Float, DateTime, Text, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 import streamlit as st
 
+logger = logging.getLogger(__name__)
+
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL')
 if not DATABASE_URL:
@@ -91,14 +94,24 @@ def get_db_session():
         return None
 
 def save_restaurant_to_db(restaurant_data, violations_data=None):
-    """Save or update restaurant data in database using raw SQL for upsert"""
+    """Save or update one restaurant; a single-row call into save_restaurants_bulk"""
+    violations_by_restaurant = None
+    if violations_data:
+        violations_by_restaurant = {restaurant_data['id']: (violations_data, restaurant_data.get('inspection_date'))}
+    return save_restaurants_bulk([restaurant_data], violations_by_restaurant)
+
+RESTAURANT_COLUMNS = ('id', 'name', 'address', 'cuisine_type', 'grade', 'score',
+                      'inspection_date', 'boro', 'phone', 'inspection_type')
+
+def save_restaurants_bulk(restaurant_records, violations_by_restaurant=None):
+    """Upsert many restaurants and their violations in a single transaction"""
+    if not restaurant_records:
+        return True
     try:
-        # Use raw SQL connection for UPSERT operation
-        import psycopg2
+        from psycopg2.extras import execute_batch
         conn = psycopg2.connect(DATABASE_URL)
         cursor = conn.cursor()
         
-        # Create restaurant table if not exists
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS restaurants (
                 id VARCHAR PRIMARY KEY,
@@ -116,8 +129,17 @@ def save_restaurant_to_db(restaurant_data, violations_data=None):
             )
         """)
         
-        # Upsert restaurant data
-        cursor.execute("""
+        # Only the table columns are sent; NaN scores become NULL
+        rows = []
+        for record in restaurant_records:
+            row = {column: record.get(column) for column in RESTAURANT_COLUMNS}
+            if row['score'] != row['score']:
+                row['score'] = None
+            rows.append(row)
+        
+        # execute_batch groups statements into few round-trips, and unlike a
+        # multi-row VALUES upsert it tolerates the same id appearing twice
+        execute_batch(cursor, """
             INSERT INTO restaurants (id, name, address, cuisine_type, grade, score, inspection_date, boro, phone, inspection_type)
             VALUES (%(id)s, %(name)s, %(address)s, %(cuisine_type)s, %(grade)s, %(score)s, %(inspection_date)s, %(boro)s, %(phone)s, %(inspection_type)s)
             ON CONFLICT (id) DO UPDATE SET
@@ -131,11 +153,9 @@ def save_restaurant_to_db(restaurant_data, violations_data=None):
                 phone = EXCLUDED.phone,
                 inspection_type = EXCLUDED.inspection_type,
                 updated_at = CURRENT_TIMESTAMP
-        """, restaurant_data)
+        """, rows, page_size=500)
         
-        # Handle violations if provided
-        if violations_data:
-            # Create violations table if not exists
+        if violations_by_restaurant:
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS violations (
                     id SERIAL PRIMARY KEY,
@@ -148,23 +168,30 @@ def save_restaurant_to_db(restaurant_data, violations_data=None):
                 )
             """)
             
-            # Clear old violations and add new ones
-            cursor.execute("DELETE FROM violations WHERE restaurant_id = %s", (restaurant_data['id'],))
+            # Clear old violations for these restaurants and add the new ones
+            cursor.execute("DELETE FROM violations WHERE restaurant_id = ANY(%s)",
+                           (list(violations_by_restaurant),))
             
-            for violation_text in violations_data:
-                if violation_text and violation_text != "No violations recorded":
-                    cursor.execute("""
-                        INSERT INTO violations (restaurant_id, violation_description, inspection_date)
-                        VALUES (%s, %s, %s)
-                    """, (restaurant_data['id'], violation_text, restaurant_data.get('inspection_date')))
+            violation_rows = [
+                (restaurant_id, violation_text, inspection_date)
+                for restaurant_id, (violations, inspection_date) in violations_by_restaurant.items()
+                for violation_text in violations
+                if violation_text and violation_text != "No violations recorded"
+            ]
+            execute_batch(cursor, """
+                INSERT INTO violations (restaurant_id, violation_description, inspection_date)
+                VALUES (%s, %s, %s)
+            """, violation_rows, page_size=500)
         
         conn.commit()
         cursor.close()
         conn.close()
         return True
         
-    except Exception as e:
-        st.error(f"Failed to save restaurant data: {str(e)}")
+    except Exception:
+        # Runs on the ingest thread, where st.error has no page to reach; the
+        # caller retries failed saves, so the failure is only logged here
+        logger.exception("Failed to save restaurant data")
         return False
 
 def get_restaurant_from_db(restaurant_id):
@@ -337,14 +364,14 @@ def get_db_statistics():
                 'grade_a_count': 0
             }
         
-        total_restaurants = session.query(Restaurant).count()
+        # One GROUP BY pass gives both the total and the per-grade counts
+        grade_counts = dict(session.query(Restaurant.grade, func.count()).group_by(Restaurant.grade).all())
         total_reviews = session.query(UserReview).count()
-        grade_a_count = session.query(Restaurant).filter(Restaurant.grade == 'A').count()
         
         return {
-            'total_restaurants': total_restaurants,
+            'total_restaurants': sum(grade_counts.values()),
             'total_reviews': total_reviews,
-            'grade_a_count': grade_a_count
+            'grade_a_count': grade_counts.get('A', 0)
         }
         
     except Exception as e:
@@ -1,18 +1,28 @@
 import streamlit as st
 from datetime import datetime
 
+# Badge colors and descriptions per grade, built once at import rather than per call
+GRADE_BADGE_COLORS = {
+    'A': {'bg': '#27AE60', 'text': 'white'},  # Success green
+    'B': {'bg': '#F39C12', 'text': 'white'},  # Warning orange
+    'C': {'bg': '#E74C3C', 'text': 'white'},  # Danger red
+    'Grade Pending': {'bg': '#95A5A6', 'text': 'white'},  # Gray
+    'Not Yet Graded': {'bg': '#BDC3C7', 'text': 'black'}   # Light gray
+}
+DEFAULT_BADGE_COLORS = {'bg': '#BDC3C7', 'text': 'black'}
+
+GRADE_DESCRIPTIONS = {
+    'A': 'Excellent - Score of 0-13 points',
+    'B': 'Good - Score of 14-27 points', 
+    'C': 'Fair - Score of 28+ points',
+    'Grade Pending': 'Inspection completed, grade pending',
+    'Not Yet Graded': 'Not yet inspected or graded'
+}
+
 def format_grade_badge(grade):
     """Format health grade as colored badge"""
     
-    grade_colors = {
-        'A': {'bg': '#27AE60', 'text': 'white'},  # Success green
-        'B': {'bg': '#F39C12', 'text': 'white'},  # Warning orange
-        'C': {'bg': '#E74C3C', 'text': 'white'},  # Danger red
-        'Grade Pending': {'bg': '#95A5A6', 'text': 'white'},  # Gray
-        'Not Yet Graded': {'bg': '#BDC3C7', 'text': 'black'}   # Light gray
-    }
-    
-    color_info = grade_colors.get(grade, {'bg': '#BDC3C7', 'text': 'black'})
+    color_info = GRADE_BADGE_COLORS.get(grade, DEFAULT_BADGE_COLORS)
     
     badge_html = f"""
     <div style="
@@ -95,15 +105,7 @@ def format_inspection_date(date_str):
 
 def get_grade_description(grade):
     """Get description for health grade"""
-    descriptions = {
-        'A': 'Excellent - Score of 0-13 points',
-        'B': 'Good - Score of 14-27 points', 
-        'C': 'Fair - Score of 28+ points',
-        'Grade Pending': 'Inspection completed, grade pending',
-        'Not Yet Graded': 'Not yet inspected or graded'
-    }
-    
-    return descriptions.get(grade, 'Grade information not available')
+    return GRADE_DESCRIPTIONS.get(grade, 'Grade information not available')
 
 def filter_dataframe_by_search(df, search_term, columns=['name', 'address', 'cuisine_type']):
     """Filter dataframe by search term across multiple columns"""